@@ -7,16 +7,24 @@ Main entry point for the client application
 import sys
 import os
 import signal
+from importlib.util import find_spec
 from PyQt5.QtWidgets import QApplication, QMessageBox, QSplashScreen
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QPixmap, QFont, QIcon, QPainter
 import qtawesome as qta
 
+# Resolve client paths once at startup
+_CLIENT_DIR = os.path.dirname(os.path.abspath(__file__))
+_SRC_DIR = os.path.join(_CLIENT_DIR, 'src')
+_ICON_PATH = os.path.join(_CLIENT_DIR, "resources", "images.ico")
+
 # Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 from config import ClientConfig
 from main_window import APKFinderMainWindow
+from adb_manager import close_adb_sessions
 
 
 class APKFinderApp(QApplication):
@@ -35,11 +43,11 @@ class APKFinderApp(QApplication):
         except:
             pass  # Ignore errors on non-Windows systems
         
-        # Load configuration
-        self.load_config()
+        # Shut down persistent adb shell sessions on exit
+        self.aboutToQuit.connect(close_adb_sessions)
         
         # Set application icon
-        icon_path = os.path.join(os.path.dirname(__file__), "resources", "images.ico")
+        icon_path = _ICON_PATH
         if os.path.exists(icon_path):
             app_icon = QIcon(icon_path)
             self.setWindowIcon(app_icon)
@@ -58,6 +66,10 @@ class APKFinderApp(QApplication):
         # Process events to show splash
         self.processEvents()
         
+        # Load configuration once the event loop runs, so the splash paints first;
+        # it still runs well before the main window is created below
+        QTimer.singleShot(0, self.load_config)
+        
         # Initialize main window
         QTimer.singleShot(2000, self.init_main_window)
     
@@ -82,7 +94,7 @@ class APKFinderApp(QApplication):
     def create_splash_screen(self):
         """Create splash screen"""
         # Try to load custom icon for splash screen
-        icon_path = os.path.join(os.path.dirname(__file__), "resources", "images.ico")
+        icon_path = _ICON_PATH
         
         if os.path.exists(icon_path):
             # Load and scale the icon
@@ -206,20 +218,10 @@ def check_dependencies():
     """Check if all required dependencies are available"""
     missing_deps = []
     
-    try:
-        import PyQt5
-    except ImportError:
-        missing_deps.append("PyQt5")
-    
-    try:
-        import qtawesome
-    except ImportError:
-        missing_deps.append("qtawesome")
-    
-    try:
-        import httpx
-    except ImportError:
-        missing_deps.append("httpx")
+    # find_spec only locates the packages, without executing them
+    for name in ("PyQt5", "qtawesome", "httpx"):
+        if find_spec(name) is None:
+            missing_deps.append(name)
     
     if missing_deps:
         print("Missing required dependencies:")
@@ -1,56 +1,332 @@
+import asyncio
+import os
 import subprocess
+import sys
 import re
-from typing import List, Dict, Optional
+import shutil
+import shlex
+import threading
+import time
+import functools
+import logging
+import tempfile
+import zipfile
+import copy
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Printed after every command in a persistent shell to mark the end of its output
+_SHELL_SENTINEL = b"__APKF_END__"
+# The sentinel and exit code end a line, but may follow output that had no
+# trailing newline; an echoed command line ("...$?") never matches
+_SHELL_END_RE = re.compile(re.escape(_SHELL_SENTINEL) + rb"(\d+)$")
+
+# Spawn adb without a console window on Windows, and outside our session (and
+# its signal handlers) elsewhere
+if sys.platform == "win32":
+    _SUBPROCESS_KW = {"creationflags": subprocess.CREATE_NO_WINDOW}
+else:
+    _SUBPROCESS_KW = {"start_new_session": True}
+
+# Returned by every operation when no adb executable was found on PATH
+_ADB_NOT_FOUND = "adb not found"
+_DEVICE_OFFLINE = "device offline"
+
+# How long the set of online serials is trusted before asking adb again (seconds)
+_ONLINE_TTL = 5
+
+# How long a device model lookup stays cached (seconds)
+_MODEL_CACHE_TTL = 600
+
+# Matches either version field of "dumpsys package" output in a single scan
+_VERSION_RE = re.compile(rb'versionName=(\S+)|versionCode=(\S+)')
+
+# Split APK bundles that are unpacked and installed with "adb install-multiple"
+_SPLIT_APK_EXTENSIONS = (".apks", ".xapk")
+
+# Install timeout: a fixed floor plus time to push the file at a slow USB rate
+_INSTALL_MIN_TIMEOUT = 60
+_INSTALL_BYTES_PER_SECOND = 4 * 1024 * 1024
+
+
+def _ttl_cache(seconds: float):
+    """Cache an ADBManager method's result per device serial for a few seconds
+    
+    Callers get a shallow copy, so mutating a returned list cannot change
+    what later callers see.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, device_serial: Optional[str] = None):
+            key = (method.__name__, device_serial)
+            cached = self._cache.get(key)
+            if cached and time.monotonic() - cached[0] < seconds:
+                return copy.copy(cached[1])
+            value = method(self, device_serial) if device_serial is not None else method(self)
+            self._cache[key] = (time.monotonic(), value)
+            return copy.copy(value)
+        return wrapper
+    return decorator
 
 
 class ADBManager:
     def __init__(self):
-        self.adb_path = "adb"  # Assume adb is in PATH
+        # Resolve adb on PATH once instead of on every spawn
+        resolved = shutil.which("adb")
+        self.adb_path = resolved or "adb"
+        self._available = resolved is not None
+        # Long-lived "adb shell" processes keyed by device serial ("" = default device)
+        self._shell_sessions: Dict[str, subprocess.Popen] = {}
+        self._session_locks: Dict[str, threading.Lock] = {}
+        self._sessions_lock = threading.Lock()
+        # serial -> (timestamp, model); a device's model does not change while connected
+        self._model_cache: Dict[str, Tuple[float, str]] = {}
+        # (method name, serial) -> (timestamp, result) for _ttl_cache
+        self._cache: Dict[Tuple[str, Optional[str]], Tuple[float, Any]] = {}
+        # Serials seen in the last device listing, so commands for unplugged
+        # devices fail fast instead of waiting out adb's timeout
+        self._online: frozenset = frozenset()
+        self._online_checked = 0.0
+    
+    def _get_session(self, serial: Optional[str]) -> Tuple[subprocess.Popen, threading.Lock]:
+        """Get (or start) the persistent shell session for a device"""
+        key = serial or ""
+        with self._sessions_lock:
+            lock = self._session_locks.setdefault(key, threading.Lock())
+            session = self._shell_sessions.get(key)
+            if session is None or session.poll() is not None:
+                cmd = [self.adb_path]
+                if serial:
+                    cmd.extend(["-s", serial])
+                cmd.append("shell")
+                session = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                           stderr=subprocess.STDOUT, **_SUBPROCESS_KW)
+                self._shell_sessions[key] = session
+        return session, lock
+    
+    def _drop_session(self, serial: Optional[str]):
+        """Terminate and forget the shell session for a device"""
+        with self._sessions_lock:
+            session = self._shell_sessions.pop(serial or "", None)
+        if session is not None:
+            try:
+                session.kill()
+                session.wait(timeout=5)
+            except Exception:
+                pass
+    
+    def _shell(self, serial: Optional[str], command: str, timeout: float = 30) -> Tuple[int, bytes]:
+        """Run a command in the device's persistent shell
+        
+        Returns (exit_code, output). Output is left as raw bytes so callers only
+        decode the parts they need.
+        """
+        returncode, lines = self._shell_lines(serial, command, timeout)
+        return returncode, b"\n".join(lines)
     
+    def _shell_lines(self, serial: Optional[str], command: str, timeout: float = 30,
+                     prefix: Optional[bytes] = None) -> Tuple[int, List[bytes]]:
+        """Run a command in the device's persistent shell, returning its output lines
+        
+        Lines are consumed as they arrive; with a prefix, only matching lines are
+        kept. The session is killed if the command does not finish within the
+        timeout, and a fresh one is started next time.
+        """
+        session, lock = self._get_session(serial)
+        timed_out = threading.Event()
+        
+        def expire():
+            timed_out.set()
+            session.kill()
+        
+        with lock:
+            timer = threading.Timer(timeout, expire)
+            timer.start()
+            try:
+                session.stdin.write(f"{command} 2>&1; echo {_SHELL_SENTINEL.decode()}$?\n".encode())
+                session.stdin.flush()
+                
+                lines = []
+                for line in session.stdout:
+                    line = line.rstrip(b"\r\n")
+                    end = _SHELL_END_RE.search(line)
+                    if end is not None:
+                        # Keep any output printed before the sentinel on the same line
+                        head = line[:end.start()]
+                        if head and (prefix is None or head.startswith(prefix)):
+                            lines.append(head)
+                        return int(end.group(1)), lines
+                    if prefix is None or line.startswith(prefix):
+                        lines.append(line)
+            except (OSError, ValueError):
+                pass
+            finally:
+                timer.cancel()
+        
+        # The shell exited or was killed before printing the sentinel
+        self._drop_session(serial)
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(command, timeout)
+        raise RuntimeError("adb shell session ended unexpectedly")
+    
+    def _invalidate_packages(self):
+        """Forget cached package lists after the installed set has changed"""
+        for key in [key for key in self._cache if key[0] == "get_installed_packages"]:
+            self._cache.pop(key, None)
+    
+    async def _run_async(self, cmd: List[str], timeout: float) -> Tuple[int, str, str]:
+        """Run an adb command as an asyncio subprocess, returning (code, stdout, stderr)"""
+        proc = await asyncio.create_subprocess_exec(*cmd, stdout=asyncio.subprocess.PIPE,
+                                                    stderr=asyncio.subprocess.PIPE,
+                                                    **_SUBPROCESS_KW)
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        finally:
+            # Timed out or cancelled: don't leave adb running (it is in its own
+            # session) or reading files the caller is about to delete
+            if proc.returncode is None:
+                try:
+                    proc.kill()
+                except ProcessLookupError:
+                    pass
+                await asyncio.shield(proc.wait())
+        
+        return (proc.returncode, stdout.decode("utf-8", "replace"),
+                stderr.decode("utf-8", "replace"))
+    
+    def close_sessions(self):
+        """Close all persistent shell sessions"""
+        with self._sessions_lock:
+            serials = list(self._shell_sessions)
+        for serial in serials:
+            self._drop_session(serial)
+    
+    @_ttl_cache(60)
     def check_adb_available(self) -> bool:
         """Check if ADB is available"""
+        if not self._available:
+            return False
+        
         try:
             result = subprocess.run([self.adb_path, "version"], 
-                                  capture_output=True, text=True, timeout=10)
+                                  capture_output=True, text=True, timeout=10, **_SUBPROCESS_KW)
             return result.returncode == 0
         except Exception:
             return False
     
     def get_connected_devices(self) -> List[Dict[str, str]]:
         """Get list of connected devices"""
+        if not self._available:
+            return []
+        
         devices = []
         try:
-            result = subprocess.run([self.adb_path, "devices"], 
-                                  capture_output=True, text=True, timeout=10)
+            result = subprocess.run([self.adb_path, "devices", "-l"], 
+                                  capture_output=True, text=True, timeout=10, **_SUBPROCESS_KW)
             
             if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')[1:]  # Skip header
-                for line in lines:
-                    if line.strip() and '\t' in line:
-                        parts = line.strip().split('\t')
-                        if len(parts) >= 2 and parts[1] == 'device':
-                            serial = parts[0]
-                            # Get device model
-                            model = self.get_device_model(serial)
-                            devices.append({
-                                "serial": serial,
-                                "model": model,
-                                "status": "device"
-                            })
+                parsed = self._parse_devices(result.stdout)
+                self._mark_online(parsed)
+                devices = self._describe_devices(parsed)
+        except Exception as e:
+            logger.warning("Error getting devices: %s", e)
+        
+        return devices
+    
+    async def get_connected_devices_async(self) -> List[Dict[str, str]]:
+        """Get list of connected devices without blocking the event loop"""
+        if not self._available:
+            return []
+        
+        devices = []
+        try:
+            returncode, stdout, _ = await self._run_async([self.adb_path, "devices", "-l"], timeout=10)
+            
+            if returncode == 0:
+                parsed = self._parse_devices(stdout)
+                self._mark_online(parsed)
+                devices = await asyncio.to_thread(self._describe_devices, parsed)
         except Exception as e:
-            print(f"Error getting devices: {e}")
+            logger.warning("Error getting devices: %s", e)
+        
+        return devices
+    
+    def _mark_online(self, devices: List[Tuple[str, Optional[str]]]):
+        """Remember which serials the latest device listing reported"""
+        self._online = frozenset(serial for serial, _ in devices)
+        self._online_checked = time.monotonic()
+    
+    def _is_online(self, serial: Optional[str]) -> bool:
+        """Check a serial against recently seen devices, relisting them when stale"""
+        if not serial:
+            return True
+        
+        if time.monotonic() - self._online_checked > _ONLINE_TTL:
+            try:
+                result = subprocess.run([self.adb_path, "devices"], 
+                                      capture_output=True, text=True, timeout=10, **_SUBPROCESS_KW)
+                if result.returncode != 0:
+                    return True  # Let the actual command report the failure
+                self._mark_online(self._parse_devices(result.stdout))
+            except Exception as e:
+                logger.warning("Error checking devices: %s", e)
+                return True
         
+        return serial in self._online
+    
+    def _parse_devices(self, output: str) -> List[Tuple[str, Optional[str]]]:
+        """Extract (serial, model) of ready devices from 'adb devices -l' output
+        
+        The model is None when adb did not report one.
+        """
+        devices = []
+        for line in output.splitlines()[1:]:  # Skip header
+            parts = line.split(None, 2)
+            if len(parts) >= 2 and parts[1] == 'device':
+                model = None
+                if len(parts) == 3:
+                    _, found, tail = f" {parts[2]}".partition(' model:')
+                    if found and tail[:1].strip():
+                        model = tail.split(None, 1)[0]
+                devices.append((parts[0], model))
         return devices
     
+    def _describe_devices(self, devices: List[Tuple[str, Optional[str]]]) -> List[Dict[str, str]]:
+        """Build device entries, looking up any missing models concurrently"""
+        missing = [serial for serial, model in devices if not model]
+        if missing:
+            # Model lookups are I/O bound, so query all devices concurrently
+            with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+                looked_up = dict(zip(missing, executor.map(self.get_device_model, missing)))
+        else:
+            looked_up = {}
+        
+        return [{"serial": serial, "model": model or looked_up[serial], "status": "device"}
+                for serial, model in devices]
+    
     def get_device_model(self, serial: str) -> str:
         """Get device model for a specific device"""
+        if not self._available:
+            return "Unknown Device"
+        if not self._is_online(serial):
+            return "Unknown Device"
+        
+        cached = self._model_cache.get(serial)
+        if cached and time.monotonic() - cached[0] < _MODEL_CACHE_TTL:
+            return cached[1]
+        
         try:
-            result = subprocess.run([self.adb_path, "-s", serial, "shell", 
-                                   "getprop", "ro.product.model"], 
-                                  capture_output=True, text=True, timeout=10)
+            returncode, output = self._shell(serial, "getprop ro.product.model", timeout=10)
             
-            if result.returncode == 0:
-                return result.stdout.strip()
+            if returncode == 0:
+                model = output.strip().decode("utf-8", "replace")
+                self._model_cache[serial] = (time.monotonic(), model)
+                return model
         except Exception:
             pass
         
@@ -58,119 +334,190 @@ class ADBManager:
     
     def install_apk(self, apk_path: str, device_serial: Optional[str] = None, 
                    replace: bool = True, allow_downgrade: bool = True, 
-                   allow_test: bool = True) -> tuple[bool, str]:
-        """Install APK to device"""
+                   allow_test: bool = True, use_streamed: bool = True) -> tuple[bool, str]:
+        """Install APK (or .apks/.xapk split bundle) to device"""
+        if not self._available:
+            return False, _ADB_NOT_FOUND
+        if not self._is_online(device_serial):
+            return False, _DEVICE_OFFLINE
+        
         try:
-            cmd = [self.adb_path]
+            with self._prepare_install(apk_path, device_serial, replace, allow_downgrade,
+                                       allow_test, use_streamed) as (cmd, timeout):
+                # Execute installation
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout,
+                                        **_SUBPROCESS_KW)
             
-            # Add device serial if specified
-            if device_serial:
-                cmd.extend(["-s", device_serial])
-            
-            cmd.append("install")
-            
-            # Add installation flags
-            if replace:
-                cmd.append("-r")  # Replace existing app
-            if allow_downgrade:
-                cmd.append("-d")  # Allow version downgrade
-            if allow_test:
-                cmd.append("-t")  # Allow test packages
-            
-            cmd.append(apk_path)
-            
-            # Execute installation
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            
-            success = result.returncode == 0 and "Success" in result.stdout
-            output = result.stdout + result.stderr
+            return self._install_result(result.returncode, result.stdout, result.stderr)
             
-            return success, output
+        except subprocess.TimeoutExpired:
+            return False, "Installation timed out"
+        except Exception as e:
+            return False, f"Installation failed: {str(e)}"
+    
+    async def install_apk_async(self, apk_path: str, device_serial: Optional[str] = None, 
+                                replace: bool = True, allow_downgrade: bool = True, 
+                                allow_test: bool = True, use_streamed: bool = True) -> tuple[bool, str]:
+        """Install APK to device without blocking the event loop"""
+        if not self._available:
+            return False, _ADB_NOT_FOUND
+        if not await asyncio.to_thread(self._is_online, device_serial):
+            return False, _DEVICE_OFFLINE
+        
+        try:
+            # Unpacking a split bundle, sizing it and removing it afterwards is
+            # file I/O, so both ends of the context run in a worker thread
+            prepared = self._prepare_install(apk_path, device_serial, replace, allow_downgrade,
+                                             allow_test, use_streamed)
+            cmd, timeout = await asyncio.to_thread(prepared.__enter__)
+            try:
+                returncode, stdout, stderr = await self._run_async(cmd, timeout=timeout)
+            finally:
+                await asyncio.to_thread(prepared.__exit__, None, None, None)
+            
+            return self._install_result(returncode, stdout, stderr)
             
         except subprocess.TimeoutExpired:
             return False, "Installation timed out"
         except Exception as e:
             return False, f"Installation failed: {str(e)}"
     
+    @contextmanager
+    def _prepare_install(self, apk_path: str, device_serial: Optional[str], replace: bool,
+                         allow_downgrade: bool, allow_test: bool, use_streamed: bool):
+        """Yield the adb install command line and its timeout
+        
+        Split bundles are unpacked into a temporary directory that lives until
+        the install has finished, and installed in one install-multiple session.
+        """
+        cmd = [self.adb_path]
+        
+        # Add device serial if specified
+        if device_serial:
+            cmd.extend(["-s", device_serial])
+        
+        split = apk_path.lower().endswith(_SPLIT_APK_EXTENSIONS)
+        cmd.append("install-multiple" if split else "install")
+        
+        # Add installation flags
+        if replace:
+            cmd.append("-r")  # Replace existing app
+        if allow_downgrade:
+            cmd.append("-d")  # Allow version downgrade
+        if allow_test:
+            cmd.append("-t")  # Allow test packages
+        if use_streamed and not split:
+            cmd.append("--streaming")  # Overlap transfer with verification
+        
+        if not split:
+            cmd.append(apk_path)
+            yield cmd, self._install_timeout([apk_path])
+            return
+        
+        with tempfile.TemporaryDirectory(prefix="apkfinder_") as temp_dir:
+            with zipfile.ZipFile(apk_path) as bundle:
+                members = [name for name in bundle.namelist() if name.lower().endswith(".apk")]
+                if not members:
+                    raise ValueError(f"No APK files found in {os.path.basename(apk_path)}")
+                apk_files = [bundle.extract(name, temp_dir) for name in members]
+            
+            cmd.extend(apk_files)
+            yield cmd, self._install_timeout(apk_files)
+    
+    def _install_timeout(self, apk_files: List[str]) -> float:
+        """Scale the install timeout with the amount of data to push"""
+        total_size = sum(os.path.getsize(path) for path in apk_files)
+        return max(_INSTALL_MIN_TIMEOUT, 30 + total_size / _INSTALL_BYTES_PER_SECOND)
+    
+    def _install_result(self, returncode: int, stdout: str, stderr: str) -> tuple[bool, str]:
+        """Interpret the outcome of an adb install"""
+        success = returncode == 0 and "Success" in stdout
+        
+        if success:
+            self._invalidate_packages()
+        
+        return success, stdout + stderr
+    
     def uninstall_package(self, package_name: str, device_serial: Optional[str] = None) -> tuple[bool, str]:
         """Uninstall package from device"""
+        if not self._available:
+            return False, _ADB_NOT_FOUND
+        if not self._is_online(device_serial):
+            return False, _DEVICE_OFFLINE
+        
         try:
-            cmd = [self.adb_path]
+            returncode, output = self._shell(device_serial, f"pm uninstall {shlex.quote(package_name)}")
             
-            if device_serial:
-                cmd.extend(["-s", device_serial])
+            success = returncode == 0 and b"Success" in output
             
-            cmd.extend(["uninstall", package_name])
+            if success:
+                self._invalidate_packages()
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            
-            success = result.returncode == 0 and "Success" in result.stdout
-            output = result.stdout + result.stderr
-            
-            return success, output
+            return success, output.decode("utf-8", "replace")
             
         except Exception as e:
             return False, f"Uninstall failed: {str(e)}"
     
+    @_ttl_cache(5)
     def get_installed_packages(self, device_serial: Optional[str] = None) -> List[str]:
         """Get list of installed packages"""
+        if not self._available:
+            return []
+        if not self._is_online(device_serial):
+            return []
+        
         try:
-            cmd = [self.adb_path]
-            
-            if device_serial:
-                cmd.extend(["-s", device_serial])
-            
-            cmd.extend(["shell", "pm", "list", "packages"])
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            returncode, lines = self._shell_lines(device_serial, "pm list packages", prefix=b'package:')
             
-            if result.returncode == 0:
-                packages = []
-                for line in result.stdout.strip().split('\n'):
-                    if line.startswith('package:'):
-                        package_name = line.replace('package:', '').strip()
-                        packages.append(package_name)
-                return packages
+            if returncode == 0:
+                return [line[8:].strip().decode('ascii', 'replace') for line in lines]
                 
         except Exception as e:
-            print(f"Error getting packages: {e}")
+            logger.warning("Error getting packages: %s", e)
         
         return []
     
     def get_package_info(self, package_name: str, device_serial: Optional[str] = None) -> Optional[Dict]:
         """Get package information"""
+        if not self._available:
+            return None
+        if not self._is_online(device_serial):
+            return None
+        
         try:
-            cmd = [self.adb_path]
-            
-            if device_serial:
-                cmd.extend(["-s", device_serial])
-            
-            cmd.extend(["shell", "dumpsys", "package", package_name])
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0:
-                output = result.stdout
-                
-                # Parse version info
-                version_match = re.search(r'versionName=([^\s]+)', output)
-                version_code_match = re.search(r'versionCode=([^\s]+)', output)
+            returncode, output = self._shell(device_serial, f"dumpsys package {shlex.quote(package_name)}")
+            
+            if returncode == 0:
+                # Parse version info, stopping once both fields are found
+                version_name = version_code = None
+                for match in _VERSION_RE.finditer(output):
+                    if match.group(1) is not None:
+                        version_name = version_name or match.group(1).decode("utf-8", "replace")
+                    else:
+                        version_code = version_code or match.group(2).decode("ascii", "replace")
+                    if version_name and version_code:
+                        break
                 
                 package_info = {
                     "package_name": package_name,
-                    "version_name": version_match.group(1) if version_match else "Unknown",
-                    "version_code": version_code_match.group(1) if version_code_match else "Unknown"
+                    "version_name": version_name or "Unknown",
+                    "version_code": version_code or "Unknown"
                 }
                 
                 return package_info
                 
         except Exception as e:
-            print(f"Error getting package info: {e}")
+            logger.warning("Error getting package info: %s", e)
         
         return None
     
     def push_file(self, local_path: str, remote_path: str, device_serial: Optional[str] = None) -> tuple[bool, str]:
         """Push file to device"""
+        if not self._available:
+            return False, _ADB_NOT_FOUND
+        if not self._is_online(device_serial):
+            return False, _DEVICE_OFFLINE
+        
         try:
             cmd = [self.adb_path]
             
@@ -179,7 +526,7 @@ class ADBManager:
             
             cmd.extend(["push", local_path, remote_path])
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60, **_SUBPROCESS_KW)
             
             success = result.returncode == 0
             output = result.stdout + result.stderr
@@ -191,6 +538,11 @@ class ADBManager:
     
     def pull_file(self, remote_path: str, local_path: str, device_serial: Optional[str] = None) -> tuple[bool, str]:
         """Pull file from device"""
+        if not self._available:
+            return False, _ADB_NOT_FOUND
+        if not self._is_online(device_serial):
+            return False, _DEVICE_OFFLINE
+        
         try:
             cmd = [self.adb_path]
             
@@ -199,7 +551,7 @@ class ADBManager:
             
             cmd.extend(["pull", remote_path, local_path])
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60, **_SUBPROCESS_KW)
             
             success = result.returncode == 0
             output = result.stdout + result.stderr
@@ -211,29 +563,40 @@ class ADBManager:
     
     def start_activity(self, package_name: str, activity_name: str = None, device_serial: Optional[str] = None) -> tuple[bool, str]:
         """Start an activity"""
+        if not self._available:
+            return False, _ADB_NOT_FOUND
+        if not self._is_online(device_serial):
+            return False, _DEVICE_OFFLINE
+        
         try:
-            cmd = [self.adb_path]
-            
-            if device_serial:
-                cmd.extend(["-s", device_serial])
-            
             if activity_name:
                 intent = f"{package_name}/{activity_name}"
             else:
                 intent = package_name
             
-            cmd.extend(["shell", "am", "start", "-n", intent])
+            returncode, output = self._shell(device_serial, f"am start -n {shlex.quote(intent)}")
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            success = returncode == 0
             
-            success = result.returncode == 0
-            output = result.stdout + result.stderr
-            
-            return success, output
+            return success, output.decode("utf-8", "replace")
             
         except Exception as e:
             return False, f"Start activity failed: {str(e)}"
 
 
-# Global ADB manager instance
-adb_manager = ADBManager()
\ No newline at end of file
+# Global ADB manager instance, created on first use
+_adb_manager: Optional[ADBManager] = None
+
+
+def get_adb_manager() -> ADBManager:
+    """Get the shared ADB manager, creating it on first use"""
+    global _adb_manager
+    if _adb_manager is None:
+        _adb_manager = ADBManager()
+    return _adb_manager
+
+
+def close_adb_sessions():
+    """Close the shared manager's shell sessions, if it was ever created"""
+    if _adb_manager is not None:
+        _adb_manager.close_sessions()
\ No newline at end of file
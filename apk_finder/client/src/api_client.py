@@ -1,3 +1,4 @@
+import asyncio
 import httpx
 import json
 from typing import List, Dict, Optional, Tuple
@@ -5,6 +6,18 @@ from datetime import datetime
 from shared.models import SearchRequest, APKFile
 from config import ClientConfig
 
+# Parse response bodies with orjson when it is installed; it reads the raw
+# bytes directly and is several times faster on large search results
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Keep idle connections open between polls so health checks and searches
+# skip the TCP handshake
+_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16, keepalive_expiry=60.0)
+
 
 class APIClient:
     def __init__(self):
@@ -13,6 +26,30 @@ class APIClient:
             "Authorization": f"Bearer {ClientConfig.API_TOKEN}",
             "Content-Type": "application/json"
         }
+        # One HTTP client per event loop, so requests reuse kept-alive connections;
+        # a client can only be used (and closed) on the loop that created it
+        self._clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client for the running event loop, creating it if needed"""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            # Forget clients whose loops are gone; their connections went with them
+            for old_loop in [old_loop for old_loop in self._clients if old_loop.is_closed()]:
+                del self._clients[old_loop]
+            client = self._clients[loop] = httpx.AsyncClient(timeout=30.0, limits=_LIMITS)
+        return client
+    
+    async def start(self):
+        """Open the HTTP client on the running loop; call once when the loop starts"""
+        self._get_client()
+    
+    async def close(self):
+        """Close the HTTP client of the running event loop"""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
     
     async def search_apk_files(self, keyword: str, server: Optional[str] = None, 
                               build_type: str = "release", limit: int = 10, 
@@ -27,20 +64,21 @@ class APIClient:
                 offset=offset
             )
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/search",
-                    headers=self.headers,
-                    json=request_data.model_dump()
-                )
+            client = self._get_client()
+            response = await client.post(
+                f"{self.base_url}/api/search",
+                headers=self.headers,
+                json=request_data.model_dump(),
+                timeout=30.0
+            )
+            
+            if response.status_code == 200:
+                data = _json_loads(response.content)
+                return data["data"]["items"], data["data"]["total"]
+            else:
+                print(f"Search failed: {response.status_code} - {response.text}")
+                return [], 0
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    return data["data"]["items"], data["data"]["total"]
-                else:
-                    print(f"Search failed: {response.status_code} - {response.text}")
-                    return [], 0
-                    
         except Exception as e:
             print(f"Error searching APK files: {e}")
             return [], 0
@@ -50,15 +88,16 @@ class APIClient:
         try:
             params = {"server": server} if server else {}
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/refresh",
-                    headers=self.headers,
-                    params=params
-                )
-                
-                return response.status_code == 200
-                
+            client = self._get_client()
+            response = await client.post(
+                f"{self.base_url}/api/refresh",
+                headers=self.headers,
+                params=params,
+                timeout=60.0
+            )
+            
+            return response.status_code == 200
+            
         except Exception as e:
             print(f"Error triggering refresh: {e}")
             return False
@@ -85,32 +124,33 @@ class APIClient:
                 "server": server
             }
             
-            async with httpx.AsyncClient(timeout=300.0) as client:
-                async with client.stream(
-                    "GET",
-                    f"{self.base_url}/api/download",
-                    headers=self.headers,
-                    params=params
-                ) as response:
-                    
-                    if response.status_code != 200:
-                        print(f"Download failed: {response.status_code}")
-                        return False
-                    
-                    total_size = int(response.headers.get("content-length", 0))
-                    downloaded = 0
-                    
-                    with open(local_path, "wb") as f:
-                        async for chunk in response.aiter_bytes(chunk_size=8192):
-                            f.write(chunk)
-                            downloaded += len(chunk)
-                            
-                            if progress_callback and total_size > 0:
-                                progress = int((downloaded / total_size) * 100)
-                                progress_callback(progress)
-                    
-                    return True
-                    
+            client = self._get_client()
+            async with client.stream(
+                "GET",
+                f"{self.base_url}/api/download",
+                headers=self.headers,
+                params=params,
+                timeout=300.0
+            ) as response:
+                
+                if response.status_code != 200:
+                    print(f"Download failed: {response.status_code}")
+                    return False
+                
+                total_size = int(response.headers.get("content-length", 0))
+                downloaded = 0
+                
+                with open(local_path, "wb") as f:
+                    async for chunk in response.aiter_bytes(chunk_size=8192):
+                        f.write(chunk)
+                        downloaded += len(chunk)
+                        
+                        if progress_callback and total_size > 0:
+                            progress = int((downloaded / total_size) * 100)
+                            progress_callback(progress)
+                
+                return True
+                
         except Exception as e:
             print(f"Error downloading file: {e}")
             return False
@@ -123,18 +163,19 @@ class APIClient:
                 "server": server
             }
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/api/file/info",
-                    headers=self.headers,
-                    params=params
-                )
+            client = self._get_client()
+            response = await client.get(
+                f"{self.base_url}/api/file/info",
+                headers=self.headers,
+                params=params,
+                timeout=30.0
+            )
+            
+            if response.status_code == 200:
+                return _json_loads(response.content)
+            else:
+                return None
                 
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    return None
-                    
         except Exception as e:
             print(f"Error getting file info: {e}")
             return None
@@ -142,17 +183,18 @@ class APIClient:
     async def get_system_status(self) -> Optional[Dict]:
         """Get system status"""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/api/status",
-                    headers=self.headers
-                )
+            client = self._get_client()
+            response = await client.get(
+                f"{self.base_url}/api/status",
+                headers=self.headers,
+                timeout=30.0
+            )
+            
+            if response.status_code == 200:
+                return _json_loads(response.content)
+            else:
+                return None
                 
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    return None
-                    
         except Exception as e:
             print(f"Error getting system status: {e}")
             return None
@@ -160,18 +202,19 @@ class APIClient:
     async def get_servers(self) -> List[Dict]:
         """Get list of available servers"""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/api/servers",
-                    headers=self.headers
-                )
+            client = self._get_client()
+            response = await client.get(
+                f"{self.base_url}/api/servers",
+                headers=self.headers,
+                timeout=30.0
+            )
+            
+            if response.status_code == 200:
+                data = _json_loads(response.content)
+                return data["data"]
+            else:
+                return []
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    return data["data"]
-                else:
-                    return []
-                    
         except Exception as e:
             print(f"Error getting servers: {e}")
             return []
@@ -179,10 +222,10 @@ class APIClient:
     async def health_check(self) -> bool:
         """Check if server is healthy"""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.base_url}/health")
-                return response.status_code == 200
-                
+            client = self._get_client()
+            response = await client.get(f"{self.base_url}/health", timeout=10.0)
+            return response.status_code == 200
+            
         except Exception as e:
             print(f"Health check failed: {e}")
             return False
@@ -1,105 +1,203 @@
 import asyncio
 import os
 import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from importlib.util import LazyLoader, find_spec, module_from_spec
 from typing import List, Dict, Optional
 from datetime import datetime
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                           QTabWidget, QTableWidget, QTableWidgetItem, QLineEdit, 
+                           QTabWidget, QTableView, QLineEdit, 
                            QPushButton, QLabel, QStatusBar, QMessageBox, QProgressBar,
                            QMenu, QHeaderView, QComboBox, QGroupBox, QSplitter,
                            QTextEdit, QFrame, QApplication, QButtonGroup)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QSize
+from PyQt5.QtCore import (Qt, pyqtSignal, QTimer, QSize, QAbstractTableModel,
+                          QModelIndex)
 from PyQt5.QtGui import QIcon, QFont, QPixmap, QCursor
 import qtawesome as qta
+from ui import styles
 from ui.styles import (get_complete_style, update_colors, get_theme_colors,
-                      update_style_constants, COLORS)
+                      update_style_constants)
 from api_client import api_client
-from adb_manager import adb_manager
+from adb_manager import get_adb_manager
 from config import ClientConfig
 from shared.utils import format_file_size
 
 
-class SearchWorker(QThread):
-    """Worker thread for API calls"""
-    search_completed = pyqtSignal(list, int)
-    error_occurred = pyqtSignal(str)
+def _lazy_import(name: str):
+    """Import a module whose body only runs on first attribute access"""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    spec.loader = LazyLoader(spec.loader)
+    module = module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# The settings dialog is rarely opened; load it on first use
+settings_dialog = _lazy_import("settings_dialog")
+
+# The background event loop uses uvloop when it is installed; uvloop does not
+# support Windows, so skip it there even if the import would succeed
+try:
+    if sys.platform == "win32":
+        raise ImportError("uvloop is not supported on Windows")
+    import uvloop
+    _new_loop = uvloop.new_event_loop
+except ImportError:
+    _new_loop = asyncio.new_event_loop
+
+# Connection status texts
+_STATUS_CONNECTED = "🟢 Connected"
+_STATUS_DISCONNECTED = "🔴 Disconnected"
+_STATUS_ERROR = "🔴 Connection Error"
+
+
+def _add_display_text(file: Dict):
+    """Store the formatted size and created time on a search result"""
+    file["_size_text"] = format_file_size(file["file_size"])
+    # "YYYY-MM-DD HH:MM" is just the head of the ISO timestamp; no parsing needed
+    ct = file.get("created_time") or ""
+    file["_time_text"] = (ct[:10] + " " + ct[11:16]) if len(ct) >= 16 else "Unknown"
+
+
+async def _search_files(keyword: str, server: str, build_type: str, limit: int, offset: int):
+    """Search and format display text (runs on the background event loop)"""
+    files, total = await api_client.search_apk_files(keyword, server, build_type, limit, offset)
     
-    def __init__(self, keyword: str, server: str, build_type: str, limit: int, offset: int):
-        super().__init__()
-        self.keyword = keyword
-        self.server = server
-        self.build_type = build_type
-        self.limit = limit
-        self.offset = offset
+    # Format display text here rather than on the UI thread
+    for file in files:
+        _add_display_text(file)
     
-    def run(self):
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            files, total = loop.run_until_complete(
-                api_client.search_apk_files(
-                    self.keyword, self.server, self.build_type, 
-                    self.limit, self.offset
-                )
-            )
-            
-            self.search_completed.emit(files, total)
-            loop.close()
-            
-        except Exception as e:
-            self.error_occurred.emit(str(e))
+    return files, total
 
 
-class DownloadWorker(QThread):
-    """Worker thread for file downloads"""
-    progress_updated = pyqtSignal(int)
-    download_completed = pyqtSignal(bool, str)
+class FileTableModel(QAbstractTableModel):
+    """Table model for search results
     
-    def __init__(self, path: str, server: str, local_path: str):
-        super().__init__()
-        self.path = path
-        self.server = server
-        self.local_path = local_path
+    Display text is formatted by the search worker; the view only asks for
+    the rows it is actually painting.
+    """
+    HEADERS = ("File Name", "Size", "Build Type", "Created Time", "Server")
     
-    def run(self):
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            def progress_callback(progress):
-                self.progress_updated.emit(progress)
-            
-            success = loop.run_until_complete(
-                api_client.download_file(
-                    self.path, self.server, self.local_path, progress_callback
-                )
-            )
-            
-            self.download_completed.emit(success, self.local_path)
-            loop.close()
-            
-        except Exception as e:
-            self.download_completed.emit(False, str(e))
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._files: List[Dict] = []
+        self._rows: List[tuple] = []
+        self._key: tuple = ()
+    
+    def set_files(self, files: List[Dict]) -> bool:
+        """Replace all rows with a new result set
+        
+        Returns False without resetting the view if the result set is unchanged.
+        """
+        key = tuple((f["server_prefix"], f["relative_path"], f["file_size"]) for f in files)
+        if key == self._key:
+            return False
+        self._key = key
+        
+        self.beginResetModel()
+        self._files = files
+        self._rows = [self._row_text(file) for file in files]
+        self.endResetModel()
+        return True
+    
+    def file_at(self, row: int) -> Optional[Dict]:
+        """Get the file data for a row"""
+        if 0 <= row < len(self._files):
+            return self._files[row]
+        return None
+    
+    @staticmethod
+    def _row_text(file: Dict) -> tuple:
+        """Collect the display text for every column of a file"""
+        return (
+            file["file_name"],
+            file["_size_text"],
+            file["build_type"],
+            file["_time_text"],
+            file.get("server_prefix", "Unknown"),
+        )
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.UserRole:
+            return self._files[index.row()]
+        return None
 
 
 class APKFinderMainWindow(QMainWindow):
+    # Emitted from the background loop thread; Qt queues them onto the UI thread
+    download_progress = pyqtSignal(int)
+    _ui_call = pyqtSignal(object)
+    
     def __init__(self):
         super().__init__()
         self.current_files = []
         self.servers = []
-        self.search_worker = None
-        self.download_worker = None
+        self._server_by_prefix = {}  # Share path -> server name
+        # One long-lived event loop runs every API coroutine, so the shared
+        # HTTP client keeps its connections alive between requests
+        self._loop = _new_loop()
+        # Bounded pool for blocking calls the loop hands off (asyncio.to_thread)
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="apkfinder-aio-worker")
+        self._loop.set_default_executor(self._executor)
+        if self._loop.get_debug():
+            # Debug runs (PYTHONASYNCIODEBUG=1 or -X dev) log any callback that
+            # blocks the loop for longer than this
+            self._loop.slow_callback_duration = 0.05
+        self._loop_thread = threading.Thread(target=self._loop.run_forever,
+                                             name="apkfinder-aio", daemon=True)
+        self._loop_thread.start()
+        self.run_async(api_client.start())
+        self._ui_call.connect(self._run_ui_call)
+        self._search_future = None
+        self._search_id = 0  # Results from older searches are ignored
+        self._download_future = None
+        self._install_future = None
+        # Rapid filter clicks collapse into one search for the latest selection
+        self._pending_search = None
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._run_pending_search)
         self.server_buttons = []
         self.selected_server = None
         self.inspector_dialog = None
+        self._message_boxes = {}  # Reused message boxes by title
         self.cached_devices = []  # Cache connected devices
-        self.recent_downloads = []  # Store recent downloads
+        self._devices_cache_expiry = 0.0
+        self._devices_cache_ttl = 3.0
+        self.recent_downloads = OrderedDict()  # Recent downloads by file name, newest first
+        self.load_download_dir()
         
         self.init_ui()
         # Apply theme after creating UI components
         self.apply_theme()
         
+        self.download_progress.connect(self.progress_bar.setValue)
+        
         self.load_servers()
         self.load_initial_data()
         self.refresh_devices()  # Load initial device list
@@ -136,7 +234,7 @@ class APKFinderMainWindow(QMainWindow):
             self.setWindowIcon(QIcon(icon_path))
         else:
             # Fallback to font icon
-            self.setWindowIcon(qta.icon('mdi.android', color=COLORS["primary"]))
+            self.setWindowIcon(qta.icon('mdi.android', color=styles.COLORS["primary"]))
         
         # Central widget
         central_widget = QWidget()
@@ -183,7 +281,7 @@ class APKFinderMainWindow(QMainWindow):
             QLabel {{
                 font-size: 24px;
                 font-weight: bold;
-                color: {COLORS["text_primary"]};
+                color: {styles.COLORS["text_primary"]};
                 margin: 0;
             }}
         """)
@@ -193,19 +291,19 @@ class APKFinderMainWindow(QMainWindow):
         
         # Refresh button
         self.refresh_btn = QPushButton("Refresh")
-        self.refresh_btn.setIcon(qta.icon('mdi.refresh', color=COLORS["white"]))
+        self.refresh_btn.setIcon(qta.icon('mdi.refresh', color=styles.COLORS["white"]))
         self.refresh_btn.clicked.connect(self.refresh_scan)
         header_layout.addWidget(self.refresh_btn)
         
         # Inspector button
         self.inspector_btn = QPushButton("Inspector")
-        self.inspector_btn.setIcon(qta.icon('mdi.bug', color=COLORS["white"]))
+        self.inspector_btn.setIcon(qta.icon('mdi.bug', color=styles.COLORS["white"]))
         self.inspector_btn.clicked.connect(self.toggle_inspector)
         header_layout.addWidget(self.inspector_btn)
         
         # Settings button
         self.settings_btn = QPushButton("Settings")
-        self.settings_btn.setIcon(qta.icon('mdi.cog', color=COLORS["white"]))
+        self.settings_btn.setIcon(qta.icon('mdi.cog', color=styles.COLORS["white"]))
         self.settings_btn.clicked.connect(self.show_settings)
         header_layout.addWidget(self.settings_btn)
         
@@ -298,7 +396,7 @@ class APKFinderMainWindow(QMainWindow):
         
         # Search button
         self.search_btn = QPushButton("Search")
-        self.search_btn.setIcon(qta.icon('mdi.magnify', color=COLORS["white"]))
+        self.search_btn.setIcon(qta.icon('mdi.magnify', color=styles.COLORS["white"]))
         self.search_btn.clicked.connect(self.search_files)
         search_layout.addWidget(self.search_btn)
         
@@ -315,18 +413,16 @@ class APKFinderMainWindow(QMainWindow):
             QLabel {{
                 font-size: 16px;
                 font-weight: bold;
-                color: {COLORS["text_primary"]};
+                color: {styles.COLORS["text_primary"]};
                 margin-bottom: 10px;
             }}
         """)
         list_layout.addWidget(list_header)
         
-        # Table widget
-        self.file_table = QTableWidget()
-        self.file_table.setColumnCount(5)
-        self.file_table.setHorizontalHeaderLabels([
-            "File Name", "Size", "Build Type", "Created Time", "Server"
-        ])
+        # Table view; rows are only materialized for the visible viewport
+        self.file_model = FileTableModel(self)
+        self.file_table = QTableView()
+        self.file_table.setModel(self.file_model)
         
         # Configure table
         header = self.file_table.horizontalHeader()
@@ -343,10 +439,11 @@ class APKFinderMainWindow(QMainWindow):
         vertical_header.setMinimumSectionSize(30)
         vertical_header.setSectionResizeMode(QHeaderView.Fixed)
         
-        self.file_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.file_table.setEditTriggers(QTableWidget.NoEditTriggers)  # Disable editing
+        self.file_table.setSelectionBehavior(QTableView.SelectRows)
+        self.file_table.setEditTriggers(QTableView.NoEditTriggers)  # Disable editing
         self.file_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.file_table.customContextMenuRequested.connect(self.show_context_menu)
+        self.file_table.selectionModel().selectionChanged.connect(self.on_file_selected)
         
         list_layout.addWidget(self.file_table)
         
@@ -363,7 +460,7 @@ class APKFinderMainWindow(QMainWindow):
             QLabel {{
                 font-size: 16px;
                 font-weight: bold;
-                color: {COLORS["text_primary"]};
+                color: {styles.COLORS["text_primary"]};
                 margin-bottom: 10px;
             }}
         """)
@@ -384,19 +481,19 @@ class APKFinderMainWindow(QMainWindow):
         button_layout = QHBoxLayout()
         
         self.download_btn = QPushButton("Download")
-        self.download_btn.setIcon(qta.icon('mdi.download', color=COLORS["white"]))
+        self.download_btn.setIcon(qta.icon('mdi.download', color=styles.COLORS["white"]))
         self.download_btn.clicked.connect(self.download_selected_file)
         self.download_btn.setEnabled(False)
         button_layout.addWidget(self.download_btn)
         
         self.install_btn = QPushButton("Auto Install")
-        self.install_btn.setIcon(qta.icon('mdi.cellphone-android', color=COLORS["white"]))
+        self.install_btn.setIcon(qta.icon('mdi.cellphone-android', color=styles.COLORS["white"]))
         self.install_btn.clicked.connect(self.auto_install_file)
         self.install_btn.setEnabled(False)
         button_layout.addWidget(self.install_btn)
         
         self.clear_recent_btn = QPushButton("Clear Recent")
-        self.clear_recent_btn.setIcon(qta.icon('mdi.delete', color=COLORS["error"]))
+        self.clear_recent_btn.setIcon(qta.icon('mdi.delete', color=styles.COLORS["error"]))
         self.clear_recent_btn.setObjectName("outlineButton")
         self.clear_recent_btn.clicked.connect(self.clear_recent_downloads)
         button_layout.addWidget(self.clear_recent_btn)
@@ -413,9 +510,9 @@ class APKFinderMainWindow(QMainWindow):
         device_layout.addWidget(self.device_list)
         
         self.refresh_devices_btn = QPushButton("Refresh Devices")
-        self.refresh_devices_btn.setIcon(qta.icon('mdi.refresh', color=COLORS["primary"]))
+        self.refresh_devices_btn.setIcon(qta.icon('mdi.refresh', color=styles.COLORS["primary"]))
         self.refresh_devices_btn.setObjectName("outlineButton")  # Set button style
-        self.refresh_devices_btn.clicked.connect(self.refresh_devices)
+        self.refresh_devices_btn.clicked.connect(lambda: self.refresh_devices(force=True))
         device_layout.addWidget(self.refresh_devices_btn)
         
         download_layout.addWidget(device_group)
@@ -437,52 +534,102 @@ class APKFinderMainWindow(QMainWindow):
         self.connection_label = QLabel("Checking connection...")
         self.status_bar.addPermanentWidget(self.connection_label)
         
-        # Check connection periodically
-        self.connection_timer = QTimer()
+        # Transient notices float above the status bar instead of opening a dialog
+        self._toast = QLabel(self)
+        self._toast.setAlignment(Qt.AlignCenter)
+        self._toast.hide()
+        self._toast_timer = QTimer(self)
+        self._toast_timer.setSingleShot(True)
+        self._toast_timer.setInterval(3000)
+        self._toast_timer.timeout.connect(self._toast.hide)
+        
+        # Check connection periodically while the window is visible (see showEvent)
+        self._conn_in_flight = False
+        self._last_status = None
+        self.connection_timer = QTimer(self)
+        self.connection_timer.setInterval(30000)  # Check every 30 seconds
         self.connection_timer.timeout.connect(self.check_connection)
-        self.connection_timer.start(30000)  # Check every 30 seconds
+        # Bursts of check requests (timer, theme changes, startup) collapse into one probe
+        self._health_timer = QTimer(self)
+        self._health_timer.setSingleShot(True)
+        self._health_timer.setInterval(250)
+        self._health_timer.timeout.connect(self._run_health_check)
+        # Built once; attached to every poll's future
+        self._health_done = partial(self._post_result, self._on_connection_checked)
         # Delay initial connection check to avoid blocking startup
         QTimer.singleShot(2000, self.check_connection)
     
+    def run_async(self, coro, callback=None):
+        """Run a coroutine on the background event loop
+        
+        If given, the callback receives the finished future on the UI thread.
+        Returns None without running anything once the loop has been closed.
+        """
+        if self._loop.is_closed():
+            coro.close()  # Late timers after closeEvent; avoid "never awaited"
+            return None
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        if callback is not None:
+            future.add_done_callback(partial(self._post_result, callback))
+        return future
+    
+    def _post_result(self, callback, future):
+        """Queue a callback with its finished future onto the UI thread"""
+        self._ui_call.emit(partial(callback, future))
+    
+    def _run_ui_call(self, func):
+        """Run a callable queued from another thread"""
+        func()
+    
+    def load_download_dir(self):
+        """Resolve the download directory once and make sure it exists
+        
+        A bad path must not stop the window from opening; the error is
+        reported when a download is attempted instead.
+        """
+        self._download_dir = ClientConfig.get_setting("download_path", ClientConfig.DEFAULT_DOWNLOAD_PATH)
+        try:
+            os.makedirs(self._download_dir, exist_ok=True)
+            self._download_dir_error = None
+        except OSError as e:
+            self._download_dir_error = f"Cannot use download directory {self._download_dir}: {e}"
+    
     def load_servers(self):
         """Load available servers"""
-        def load_servers_async():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
-                servers = loop.run_until_complete(api_client.get_servers())
-                
-                self.servers = servers
-                
-                # Remove existing server buttons (except "All Servers")
-                for button in self.server_buttons[1:]:  # Skip first button (All Servers)
-                    self.server_button_group.removeButton(button)
-                    button.deleteLater()
-                
-                self.server_buttons = [self.all_servers_btn]  # Keep only "All Servers"
-                
-                # Add new server buttons
-                server_group = self.all_servers_btn.parent()
-                server_layout = server_group.layout()
-                
-                for server in servers:
-                    server_btn = QPushButton(server["display_name"])
-                    server_btn.setCheckable(True)
-                    server_btn.setObjectName("serverButton")
-                    server_btn.setProperty("serverData", server["name"])
-                    server_btn.setMaximumHeight(35)  # Limit button height
-                    
-                    self.server_button_group.addButton(server_btn)
-                    self.server_buttons.append(server_btn)
-                    server_layout.addWidget(server_btn)
-                
-                loop.close()
+        self.run_async(api_client.get_servers(), self._on_servers_loaded)
+    
+    def _on_servers_loaded(self, future):
+        """Rebuild the server buttons once the server list arrives"""
+        try:
+            servers = future.result()
+            
+            self.servers = servers
+            self._server_by_prefix = {server["path"]: server["name"] for server in servers}
+            
+            # Remove existing server buttons (except "All Servers")
+            for button in self.server_buttons[1:]:  # Skip first button (All Servers)
+                self.server_button_group.removeButton(button)
+                button.deleteLater()
+            
+            self.server_buttons = [self.all_servers_btn]  # Keep only "All Servers"
+            
+            # Add new server buttons
+            server_group = self.all_servers_btn.parent()
+            server_layout = server_group.layout()
+            
+            for server in servers:
+                server_btn = QPushButton(server["display_name"])
+                server_btn.setCheckable(True)
+                server_btn.setObjectName("serverButton")
+                server_btn.setProperty("serverData", server["name"])
+                server_btn.setMaximumHeight(35)  # Limit button height
                 
-            except Exception as e:
-                self.show_error(f"Failed to load servers: {e}")
-        
-        QTimer.singleShot(100, load_servers_async)
+                self.server_button_group.addButton(server_btn)
+                self.server_buttons.append(server_btn)
+                server_layout.addWidget(server_btn)
+            
+        except Exception as e:
+            self.show_error(f"Failed to load servers: {e}")
     
     def load_initial_data(self):
         """Load initial data (latest files)"""
@@ -491,7 +638,7 @@ class APKFinderMainWindow(QMainWindow):
     def search_files(self):
         """Search for files"""
         keyword = self.search_input.text().strip()
-        self.search_files_internal(keyword)
+        self.queue_search(keyword)
     
     def on_server_selected(self, button):
         """Handle server button selection"""
@@ -499,12 +646,28 @@ class APKFinderMainWindow(QMainWindow):
         self.selected_server = server_data
         
         # Trigger search with new server selection
-        self.search_files_internal("", limit=ClientConfig.DEFAULT_RESULTS_PER_PAGE)
+        self.queue_search("", limit=ClientConfig.DEFAULT_RESULTS_PER_PAGE)
+    
+    def queue_search(self, keyword: str, limit: int = None):
+        """Schedule a search, replacing any not yet started"""
+        self._pending_search = (keyword, limit)
+        self._search_timer.start()
+    
+    def _run_pending_search(self):
+        """Run the most recently queued search"""
+        pending = self._pending_search
+        if pending is None:
+            return
+        self._pending_search = None
+        
+        self.search_files_internal(*pending)
     
     def search_files_internal(self, keyword: str, limit: int = None):
         """Internal search method"""
-        if self.search_worker and self.search_worker.isRunning():
-            return
+        # A newer search supersedes one still queued or in flight
+        if self._search_future is not None:
+            self._search_future.cancel()
+        self._search_id += 1
         
         server = self.selected_server
         build_type = self.get_current_build_type()
@@ -513,10 +676,10 @@ class APKFinderMainWindow(QMainWindow):
         self.search_btn.setEnabled(False)
         self.status_label.setText("Searching...")
         
-        self.search_worker = SearchWorker(keyword, server, build_type, limit, 0)
-        self.search_worker.search_completed.connect(self.on_search_completed)
-        self.search_worker.error_occurred.connect(self.on_search_error)
-        self.search_worker.start()
+        self._search_future = self.run_async(
+            _search_files(keyword, server, build_type, limit, 0),
+            partial(self.on_search_completed, self._search_id)
+        )
     
     def get_current_build_type(self) -> str:
         """Get current build type from button group"""
@@ -530,10 +693,19 @@ class APKFinderMainWindow(QMainWindow):
         build_type = button.property("buildType")
         
         # Trigger search with new build type selection
-        self.search_files_internal("", limit=ClientConfig.DEFAULT_RESULTS_PER_PAGE)
+        self.queue_search("", limit=ClientConfig.DEFAULT_RESULTS_PER_PAGE)
     
-    def on_search_completed(self, files: List[Dict], total: int):
+    def on_search_completed(self, search_id: int, future):
         """Handle search completion"""
+        if search_id != self._search_id or future.cancelled():
+            return
+        
+        try:
+            files, total = future.result()
+        except Exception as e:
+            self.on_search_error(str(e))
+            return
+        
         self.current_files = files
         self.populate_file_table(files)
         
@@ -548,51 +720,19 @@ class APKFinderMainWindow(QMainWindow):
     
     def populate_file_table(self, files: List[Dict]):
         """Populate file table with data"""
-        self.file_table.setRowCount(len(files))
-        
-        # Temporarily disable selection change signal to avoid performance issues
-        try:
-            self.file_table.itemSelectionChanged.disconnect(self.on_file_selected)
-            reconnect_needed = True
-        except TypeError:
-            # Signal was not connected yet
-            reconnect_needed = False
-        
-        for row, file in enumerate(files):
-            # File name
-            name_item = QTableWidgetItem(file["file_name"])
-            name_item.setData(Qt.UserRole, file)
-            self.file_table.setItem(row, 0, name_item)
-            
-            # File size
-            size_item = QTableWidgetItem(format_file_size(file["file_size"]))
-            self.file_table.setItem(row, 1, size_item)
-            
-            # Build type
-            build_item = QTableWidgetItem(file["build_type"])
-            self.file_table.setItem(row, 2, build_item)
-            
-            # Created time - optimize by caching formatted time
-            try:
-                created_time = datetime.fromisoformat(file["created_time"].replace('Z', '+00:00'))
-                time_str = created_time.strftime("%Y-%m-%d %H:%M")
-            except (ValueError, TypeError):
-                time_str = "Unknown"
-            time_item = QTableWidgetItem(time_str)
-            self.file_table.setItem(row, 3, time_item)
-            
-            # Server
-            server_item = QTableWidgetItem(file.get("server_prefix", "Unknown"))
-            self.file_table.setItem(row, 4, server_item)
+        if not self.file_model.set_files(files):
+            return  # Same results; keep the current rows and selection
         
-        # Re-connect selection change if it was previously connected
-        if reconnect_needed:
-            self.file_table.itemSelectionChanged.connect(self.on_file_selected)
+        # A model reset clears the selection without emitting selectionChanged
+        self.on_file_selected()
+    
+    def selected_file(self) -> Optional[Dict]:
+        """Get the file data of the current row, if any"""
+        return self.file_model.file_at(self.file_table.currentIndex().row())
     
     def on_file_selected(self):
         """Handle file selection"""
-        current_row = self.file_table.currentRow()
-        if current_row >= 0:
+        if self.file_table.selectionModel().hasSelection():
             # Enable download button and update install button
             self.download_btn.setEnabled(True)
             self.update_install_button()
@@ -602,15 +742,13 @@ class APKFinderMainWindow(QMainWindow):
     
     def show_context_menu(self, position):
         """Show context menu for file table"""
-        if self.file_table.itemAt(position) is None:
+        if not self.file_table.indexAt(position).isValid():
             return
         
-        current_row = self.file_table.currentRow()
-        if current_row < 0:
+        file_data = self.selected_file()
+        if file_data is None:
             return
         
-        file_data = self.file_table.item(current_row, 0).data(Qt.UserRole)
-        
         menu = QMenu(self)
         
         # Copy SMB path
@@ -676,20 +814,20 @@ class APKFinderMainWindow(QMainWindow):
     
     def download_selected_file(self):
         """Download selected file"""
-        current_row = self.file_table.currentRow()
-        if current_row < 0:
+        file_data = self.selected_file()
+        if file_data is None:
             return
         
-        file_data = self.file_table.item(current_row, 0).data(Qt.UserRole)
-        
         # Generate local file path
-        download_dir = ClientConfig.get_setting("download_path", ClientConfig.DEFAULT_DOWNLOAD_PATH)
-        os.makedirs(download_dir, exist_ok=True)
-        
-        local_path = os.path.join(download_dir, file_data['file_name'])
+        if self._download_dir_error is not None:
+            self.load_download_dir()  # It may have been fixed or mounted since
+            if self._download_dir_error is not None:
+                self.show_error(self._download_dir_error)
+                return
+        local_path = os.path.join(self._download_dir, file_data['file_name'])
         
         # Start download
-        if self.download_worker and self.download_worker.isRunning():
+        if self._download_future is not None and not self._download_future.done():
             self.show_error("Another download is in progress")
             return
         
@@ -701,21 +839,40 @@ class APKFinderMainWindow(QMainWindow):
         # Find server name from file data
         server_name = self.find_server_name_from_prefix(file_data['server_prefix'])
         
-        self.download_worker = DownloadWorker(
-            file_data['relative_path'], 
-            server_name, 
-            local_path
+        self._download_future = self.run_async(
+            api_client.download_file(file_data['relative_path'], server_name, local_path,
+                                     self._make_progress_callback()),
+            partial(self._on_download_finished, local_path)
         )
-        self.download_worker.progress_updated.connect(self.progress_bar.setValue)
-        self.download_worker.download_completed.connect(self.on_download_completed)
-        self.download_worker.start()
+    
+    def _make_progress_callback(self):
+        """Create a download progress callback (called on the background loop)"""
+        last = [-1, 0.0]  # Last emitted percentage and when it was emitted
+        
+        def progress_callback(progress):
+            # Progress arrives per 8 KB chunk; forward at most ~30 updates a
+            # second, but always deliver the final 100%
+            if progress == last[0]:
+                return
+            now = time.monotonic()
+            if progress >= 100 or now - last[1] > 0.033:
+                last[0], last[1] = progress, now
+                self.download_progress.emit(progress)
+        
+        return progress_callback
+    
+    def _on_download_finished(self, local_path: str, future):
+        """Report a finished download"""
+        if future.cancelled():
+            return
+        try:
+            self.on_download_completed(future.result(), local_path)
+        except Exception as e:
+            self.on_download_completed(False, str(e))
     
     def find_server_name_from_prefix(self, prefix: str) -> str:
         """Find server name from prefix"""
-        for server in self.servers:
-            if server["path"] == prefix:
-                return server["name"]
-        return "server_1"  # fallback
+        return self._server_by_prefix.get(prefix, "server_1")  # fallback
     
     def on_download_completed(self, success: bool, path_or_error: str):
         """Handle download completion"""
@@ -738,12 +895,10 @@ class APKFinderMainWindow(QMainWindow):
             self.show_error("No devices connected. Please connect a device and refresh devices list.")
             return
         
-        current_row = self.file_table.currentRow()
-        if current_row < 0:
+        file_data = self.selected_file()
+        if file_data is None:
             return
         
-        file_data = self.file_table.item(current_row, 0).data(Qt.UserRole)
-        
         if len(self.cached_devices) == 1:
             self.install_to_device(file_data, self.cached_devices[0]['serial'])
         else:
@@ -753,15 +908,35 @@ class APKFinderMainWindow(QMainWindow):
     def install_to_device(self, file_data: Dict, device_serial: str):
         """Install APK to specific device"""
         # First download the file
-        download_dir = ClientConfig.get_setting("download_path", ClientConfig.DEFAULT_DOWNLOAD_PATH)
-        local_path = os.path.join(download_dir, file_data['file_name'])
+        local_path = os.path.join(self._download_dir, file_data['file_name'])
         
         if not os.path.exists(local_path):
             self.show_error("File not downloaded yet. Please download first.")
             return
         
-        # Install using ADB
-        success, output = adb_manager.install_apk(local_path, device_serial)
+        if self._install_future is not None and not self._install_future.done():
+            self.show_error("Another installation is in progress")
+            return
+        
+        # Install using ADB; adb install can take several seconds, so it
+        # runs on the background loop instead of blocking the UI
+        self.install_btn.setEnabled(False)
+        self.status_label.setText("Installing...")
+        self._install_future = self.run_async(
+            get_adb_manager().install_apk_async(local_path, device_serial),
+            partial(self._on_install_finished, device_serial)
+        )
+    
+    def _on_install_finished(self, device_serial: str, future):
+        """Report a finished installation"""
+        self._install_future = None
+        self.update_install_button()
+        if future.cancelled():
+            return
+        try:
+            success, output = future.result()
+        except Exception as e:
+            success, output = False, str(e)
         
         if success:
             self.show_info(f"APK installed successfully to device {device_serial}")
@@ -772,16 +947,32 @@ class APKFinderMainWindow(QMainWindow):
     
     def update_install_button(self):
         """Update install button state"""
-        self.install_btn.setEnabled(len(self.cached_devices) > 0)
+        self.install_btn.setEnabled(len(self.cached_devices) > 0 and self._install_future is None)
     
-    def refresh_devices(self):
-        """Refresh connected devices"""
-        self.cached_devices = adb_manager.get_connected_devices()
+    def refresh_devices(self, force: bool = False):
+        """Refresh connected devices, querying adb at most once per TTL unless forced"""
+        if not force and time.monotonic() <= self._devices_cache_expiry:
+            self.show_devices()
+            return
         
-        if self.cached_devices:
-            device_text = "\n".join([f"📱 {device['model']} ({device['serial']})" for device in self.cached_devices])
-        else:
-            device_text = "No devices connected"
+        self.run_async(get_adb_manager().get_connected_devices_async(), self._on_devices_loaded)
+    
+    def _on_devices_loaded(self, future):
+        """Store a finished device listing and show it"""
+        if future.cancelled():
+            return
+        try:
+            self.cached_devices = future.result()
+        except Exception:
+            self.cached_devices = []
+        self._devices_cache_expiry = time.monotonic() + self._devices_cache_ttl
+        self.show_devices()
+    
+    def show_devices(self):
+        """Show the cached device list"""
+        device_text = "\n".join(
+            f"📱 {device['model']} ({device['serial']})" for device in self.cached_devices
+        ) or "No devices connected"
         
         self.device_list.setText(device_text)
         self.update_install_button()
@@ -794,14 +985,14 @@ class APKFinderMainWindow(QMainWindow):
             "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
         
-        # Remove if already exists
-        self.recent_downloads = [d for d in self.recent_downloads if d["name"] != file_name]
-        
-        # Add to beginning
-        self.recent_downloads.insert(0, download_info)
+        # Add to beginning, replacing any earlier entry for the same file
+        self.recent_downloads.pop(file_name, None)
+        self.recent_downloads[file_name] = download_info
+        self.recent_downloads.move_to_end(file_name, last=False)
         
         # Keep only last 10 downloads
-        self.recent_downloads = self.recent_downloads[:10]
+        while len(self.recent_downloads) > 10:
+            self.recent_downloads.popitem(last=True)
         
         # Update display
         self.update_recent_downloads_display()
@@ -812,12 +1003,11 @@ class APKFinderMainWindow(QMainWindow):
             self.recent_downloads_list.setText("No recent downloads...")
             return
         
-        download_text = ""
-        for download in self.recent_downloads:
-            download_text += f"📁 {download['name']}\n"
-            download_text += f"   {download['time']}\n\n"
+        download_text = "\n\n".join(
+            f"📁 {download['name']}\n   {download['time']}" for download in self.recent_downloads.values()
+        )
         
-        self.recent_downloads_list.setText(download_text.strip())
+        self.recent_downloads_list.setText(download_text)
     
     def clear_recent_downloads(self):
         """Clear recent downloads list"""
@@ -829,52 +1019,59 @@ class APKFinderMainWindow(QMainWindow):
         self.refresh_btn.setEnabled(False)
         self.status_label.setText("Refreshing...")
         
-        def refresh_async():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
-                success = loop.run_until_complete(api_client.refresh_scan())
-                
-                if success:
-                    self.status_label.setText("Refresh triggered successfully")
-                    QTimer.singleShot(2000, lambda: self.search_files_internal("", limit=ClientConfig.DEFAULT_RESULTS_PER_PAGE))
-                else:
-                    self.status_label.setText("Refresh failed")
-                
-                self.refresh_btn.setEnabled(True)
-                loop.close()
-                
-            except Exception as e:
-                self.refresh_btn.setEnabled(True)
+        self.run_async(api_client.refresh_scan(), self._on_refresh_finished)
+    
+    def _on_refresh_finished(self, future):
+        """Handle the result of a refresh request"""
+        try:
+            success = future.result()
+            
+            if success:
+                self.status_label.setText("Refresh triggered successfully")
+                QTimer.singleShot(2000, lambda: self.queue_search("", limit=ClientConfig.DEFAULT_RESULTS_PER_PAGE))
+            else:
                 self.status_label.setText("Refresh failed")
-                self.show_error(f"Refresh failed: {e}")
-        
-        QTimer.singleShot(100, refresh_async)
+            
+            self.refresh_btn.setEnabled(True)
+            
+        except Exception as e:
+            self.refresh_btn.setEnabled(True)
+            self.status_label.setText("Refresh failed")
+            self.show_error(f"Refresh failed: {e}")
     
     def check_connection(self):
+        """Schedule a server connection check, merging it with any pending one"""
+        self._health_timer.start()
+    
+    def _run_health_check(self):
         """Check server connection"""
-        def check_async():
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
-                healthy = loop.run_until_complete(api_client.health_check())
-                
-                if healthy:
-                    self.connection_label.setText("🟢 Connected")
-                    self.connection_label.setStyleSheet(f"color: {COLORS['success']};")
-                else:
-                    self.connection_label.setText("🔴 Disconnected")
-                    self.connection_label.setStyleSheet(f"color: {COLORS['error']};")
-                
-                loop.close()
-                
-            except Exception:
-                self.connection_label.setText("🔴 Connection Error")
-                self.connection_label.setStyleSheet(f"color: {COLORS['error']};")
+        # Skip if a check is already running, or the window has been closed
+        if self._conn_in_flight or self._loop.is_closed():
+            return
+        self._conn_in_flight = True
+        
+        future = asyncio.run_coroutine_threadsafe(api_client.health_check(), self._loop)
+        future.add_done_callback(self._health_done)
+    
+    def _on_connection_checked(self, future):
+        """Show the result of a health check"""
+        self._conn_in_flight = False
+        try:
+            status = _STATUS_CONNECTED if future.result() else _STATUS_DISCONNECTED
+        except Exception:
+            status = _STATUS_ERROR
         
-        QTimer.singleShot(100, check_async)
+        self.set_connection_status(status)
+    
+    def set_connection_status(self, status: str):
+        """Update the connection label; steady-state polls change nothing"""
+        if status == self._last_status:
+            return
+        self._last_status = status
+        
+        color = styles.COLORS['success'] if status == _STATUS_CONNECTED else styles.COLORS['error']
+        self.connection_label.setText(status)
+        self.connection_label.setStyleSheet(f"color: {color};")
     
     def toggle_inspector(self):
         """Toggle UI inspector"""
@@ -891,17 +1088,21 @@ class APKFinderMainWindow(QMainWindow):
     
     def show_settings(self):
         """Show settings dialog"""
-        from settings_dialog import SettingsDialog
-        dialog = SettingsDialog(self)
+        dialog = settings_dialog.SettingsDialog(self)
         
         # Store current theme
         current_theme = ClientConfig.get_setting("theme", "Light")
         
-        if dialog.exec_() == dialog.Accepted:
-            # Check if theme changed
-            new_theme = ClientConfig.get_setting("theme", "Light")
-            if new_theme != current_theme:
-                self.apply_theme(new_theme)
+        dialog.exec_()
+        
+        # Settings may have been saved with Apply even if the dialog was then
+        # cancelled, so pick up changes whatever the result
+        self.load_download_dir()
+        
+        # Check if theme changed
+        new_theme = ClientConfig.get_setting("theme", "Light")
+        if new_theme != current_theme:
+            self.apply_theme(new_theme)
     
     def show_file_details(self, file_data: Dict):
         """Show detailed file information"""
@@ -932,11 +1133,35 @@ class APKFinderMainWindow(QMainWindow):
     
     def show_error(self, message: str):
         """Show error message"""
-        QMessageBox.critical(self, "Error", message)
+        self._show_message(QMessageBox.Critical, "Error", message)
     
     def show_info(self, message: str):
-        """Show info message"""
-        QMessageBox.information(self, "Information", message)
+        """Show info message as a toast; errors stay modal"""
+        self._toast.setText(message)
+        self._toast.setStyleSheet(
+            f"background-color: {styles.COLORS['text_primary']}; color: {styles.COLORS['background']};"
+            " border-radius: 6px; padding: 8px 16px;"
+        )
+        self._toast.adjustSize()
+        
+        # Bottom center, just above the status bar
+        x = (self.width() - self._toast.width()) // 2
+        y = self.height() - self.status_bar.height() - self._toast.height() - 16
+        self._toast.move(x, y)
+        self._toast.show()
+        self._toast.raise_()
+        self._toast_timer.start()
+    
+    def _show_message(self, icon, title: str, message: str):
+        """Show a message in a reused box; a burst of messages updates one open box"""
+        box = self._message_boxes.get(title)
+        if box is None:
+            box = QMessageBox(icon, title, "", QMessageBox.Ok, self)
+            self._message_boxes[title] = box
+        
+        box.setText(message)
+        if not box.isVisible():
+            box.open()
     
     def apply_theme(self, theme: str = None):
         """Apply theme to the application"""
@@ -999,14 +1224,40 @@ class APKFinderMainWindow(QMainWindow):
         
         # Update connection status colors if available
         if hasattr(self, 'connection_label'):
+            self._last_status = None  # Restyle even if the status is unchanged
             self.check_connection()
     
+    def showEvent(self, event):
+        """Resume periodic connection checks when the window is shown"""
+        super().showEvent(event)
+        if not self.connection_timer.isActive():
+            self.connection_timer.start()
+    
+    def hideEvent(self, event):
+        """Pause periodic connection checks while hidden or minimized"""
+        super().hideEvent(event)
+        self.connection_timer.stop()
+    
     def closeEvent(self, event):
         """Handle application close"""
-        # Stop any running workers
-        if self.search_worker and self.search_worker.isRunning():
-            self.search_worker.terminate()
-        if self.download_worker and self.download_worker.isRunning():
-            self.download_worker.terminate()
+        # Stop timers that would submit more work to the loop
+        for timer in (self._health_timer, self._search_timer, self.connection_timer):
+            timer.stop()
+        
+        # Cancel running work; cancelling these futures cancels their tasks on the loop
+        for future in (self._search_future, self._download_future, self._install_future):
+            if future is not None and not future.done():
+                future.cancel()
+        
+        # Close the shared HTTP client, then stop the background loop
+        try:
+            self.run_async(api_client.close()).result(timeout=2)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join(timeout=2)
+        if not self._loop_thread.is_alive():
+            self._loop.close()  # Release the loop's transports and selector/uv handle
+        self._executor.shutdown(wait=False, cancel_futures=True)
         
         event.accept()
\ No newline at end of file
@@ -1,11 +1,12 @@
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, 
                            QWidget, QLabel, QLineEdit, QPushButton, QFileDialog,
                            QGroupBox, QCheckBox, QSpinBox, QComboBox, QTextEdit,
-                           QFormLayout, QDialogButtonBox, QMessageBox)
-from PyQt5.QtCore import Qt
+                           QFormLayout, QDialogButtonBox, QMessageBox, QAction)
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont
 import qtawesome as qta
-from ui.styles import get_complete_style, COLORS, get_theme_colors, update_colors, update_style_constants
+from ui import styles
+from ui.styles import get_complete_style, get_theme_colors, update_colors, update_style_constants
 from config import ClientConfig
 
 
@@ -15,6 +16,15 @@ class SettingsDialog(QDialog):
         self.setWindowTitle("Settings")
         self.setModal(True)
         self.resize(600, 500)
+        # Stripped text of the line edits, kept current by textChanged
+        self._text_cache: dict[str, str] = {}
+        # Theme changes are applied once the event loop is idle so that a
+        # burst of combo box changes only restyles the UI once
+        self._pending_theme = None
+        self._theme_timer = QTimer(self)
+        self._theme_timer.setSingleShot(True)
+        self._theme_timer.setInterval(0)
+        self._theme_timer.timeout.connect(self._apply_pending_theme)
         # Apply theme
         self.apply_theme()
         
@@ -23,28 +33,41 @@ class SettingsDialog(QDialog):
     
     def init_ui(self):
         """Initialize the user interface"""
-        layout = QVBoxLayout(self)
-        
-        # Create tab widget
-        self.tab_widget = QTabWidget()
-        layout.addWidget(self.tab_widget)
-        
-        # Create tabs
-        self.create_general_tab()
-        self.create_server_tab()
-        self.create_download_tab()
-        self.create_ui_tab()
-        self.create_advanced_tab()
-        
-        # Button box
-        button_box = QDialogButtonBox(
-            QDialogButtonBox.Ok | QDialogButtonBox.Cancel | QDialogButtonBox.Apply
-        )
-        button_box.accepted.connect(self.accept_settings)
-        button_box.rejected.connect(self.reject)
-        button_box.button(QDialogButtonBox.Apply).clicked.connect(self.apply_settings)
-        
-        layout.addWidget(button_box)
+        # Suspend repaints while the tabs are built so layout runs once on show
+        self.setUpdatesEnabled(False)
+        try:
+            layout = QVBoxLayout(self)
+            
+            # Create tab widget
+            self.tab_widget = QTabWidget()
+            layout.addWidget(self.tab_widget)
+            
+            # Create tabs
+            self.create_general_tab()
+            self.create_server_tab()
+            self.create_download_tab()
+            self.create_ui_tab()
+            self.create_advanced_tab()
+            
+            for key, line_edit in (("server_url", self.server_url),
+                                   ("api_token", self.api_token),
+                                   ("download_path", self.download_path),
+                                   ("temp_path", self.temp_path),
+                                   ("adb_path", self.adb_path),
+                                   ("install_flags", self.install_flags)):
+                self._track_text(key, line_edit)
+            
+            # Button box
+            button_box = QDialogButtonBox(
+                QDialogButtonBox.Ok | QDialogButtonBox.Cancel | QDialogButtonBox.Apply
+            )
+            button_box.accepted.connect(self.accept_settings)
+            button_box.rejected.connect(self.reject)
+            button_box.button(QDialogButtonBox.Apply).clicked.connect(self.apply_settings)
+            
+            layout.addWidget(button_box)
+        finally:
+            self.setUpdatesEnabled(True)
     
     def create_general_tab(self):
         """Create general settings tab"""
@@ -110,7 +133,7 @@ class SettingsDialog(QDialog):
         # Test connection button
         test_layout = QHBoxLayout()
         self.test_connection_btn = QPushButton("Test Connection")
-        self.test_connection_btn.setIcon(qta.icon('mdi.network', color=COLORS["white"]))
+        self.test_connection_btn.setIcon(qta.icon('mdi.network', color=styles.COLORS["white"]))
         self.test_connection_btn.setObjectName("primaryButton")
         self.test_connection_btn.clicked.connect(self.test_connection)
         test_layout.addWidget(self.test_connection_btn)
@@ -150,28 +173,24 @@ class SettingsDialog(QDialog):
         path_layout = QFormLayout(path_group)
         
         # Default download path
-        download_layout = QHBoxLayout()
         self.download_path = QLineEdit()
-        download_layout.addWidget(self.download_path)
-        
-        browse_btn = QPushButton("Browse...")
-        browse_btn.setObjectName("secondaryButton")  # Set button style
-        browse_btn.clicked.connect(self.browse_download_path)
-        download_layout.addWidget(browse_btn)
+        self.browse_download_action = QAction(
+            qta.icon('mdi.folder-open', color=styles.COLORS["text_secondary"]), "Browse...", self.download_path
+        )
+        self.browse_download_action.triggered.connect(self.browse_download_path)
+        self.download_path.addAction(self.browse_download_action, QLineEdit.TrailingPosition)
         
-        path_layout.addRow("Default Download Path:", download_layout)
+        path_layout.addRow("Default Download Path:", self.download_path)
         
         # Temporary files path
-        temp_layout = QHBoxLayout()
         self.temp_path = QLineEdit()
-        temp_layout.addWidget(self.temp_path)
-        
-        browse_temp_btn = QPushButton("Browse...")
-        browse_temp_btn.setObjectName("secondaryButton")  # Set button style
-        browse_temp_btn.clicked.connect(self.browse_temp_path)
-        temp_layout.addWidget(browse_temp_btn)
+        self.browse_temp_action = QAction(
+            qta.icon('mdi.folder-open', color=styles.COLORS["text_secondary"]), "Browse...", self.temp_path
+        )
+        self.browse_temp_action.triggered.connect(self.browse_temp_path)
+        self.temp_path.addAction(self.browse_temp_action, QLineEdit.TrailingPosition)
         
-        path_layout.addRow("Temporary Files Path:", temp_layout)
+        path_layout.addRow("Temporary Files Path:", self.temp_path)
         
         layout.addWidget(path_group)
         
@@ -295,7 +314,7 @@ class SettingsDialog(QDialog):
         # Clear cache button
         clear_cache_layout = QHBoxLayout()
         self.clear_cache_btn = QPushButton("Clear Cache")
-        self.clear_cache_btn.setIcon(qta.icon('mdi.delete', color=COLORS["white"]))
+        self.clear_cache_btn.setIcon(qta.icon('mdi.delete', color=styles.COLORS["white"]))
         self.clear_cache_btn.setObjectName("primaryButton")
         self.clear_cache_btn.clicked.connect(self.clear_cache)
         clear_cache_layout.addWidget(self.clear_cache_btn)
@@ -322,10 +341,29 @@ class SettingsDialog(QDialog):
         layout.addStretch()
         self.tab_widget.addTab(tab, "Advanced")
     
+    def _track_text(self, key: str, line_edit: QLineEdit):
+        """Keep the stripped text of a line edit in the text cache"""
+        def on_text_changed(text: str):
+            self._text_cache[key] = text.strip()
+        
+        on_text_changed(line_edit.text())
+        line_edit.textChanged.connect(on_text_changed)
+    
     def load_settings(self):
         """Load settings from configuration"""
-        config = ClientConfig.load_config()
-        
+        # Block change signals while populating so loading does not trigger
+        # handlers such as on_theme_changed
+        inputs = self.findChildren((QCheckBox, QSpinBox, QComboBox))
+        for widget in inputs:
+            widget.blockSignals(True)
+        try:
+            self._load_settings(ClientConfig.load_config())
+        finally:
+            for widget in inputs:
+                widget.blockSignals(False)
+    
+    def _load_settings(self, config: dict):
+        """Populate the form widgets from a configuration dict"""
         # General settings
         self.auto_check_updates.setChecked(config.get("auto_check_updates", True))
         self.startup_scan.setChecked(config.get("startup_scan", False))
@@ -383,14 +421,14 @@ class SettingsDialog(QDialog):
             "search_history": self.search_history.isChecked(),
             
             # Server
-            "server_url": self.server_url.text().strip(),
-            "api_token": self.api_token.text().strip(),
+            "server_url": self._text_cache["server_url"],
+            "api_token": self._text_cache["api_token"],
             "connection_timeout": self.connection_timeout.value(),
             "retry_attempts": self.retry_attempts.value(),
             
             # Download
-            "download_path": self.download_path.text().strip(),
-            "temp_path": self.temp_path.text().strip(),
+            "download_path": self._text_cache["download_path"],
+            "temp_path": self._text_cache["temp_path"],
             "auto_verify_md5": self.auto_verify_md5.isChecked(),
             "overwrite_existing": self.overwrite_existing.isChecked(),
             "open_download_folder": self.open_download_folder.isChecked(),
@@ -407,9 +445,9 @@ class SettingsDialog(QDialog):
             "auto_resize_columns": self.auto_resize_columns.isChecked(),
             
             # Advanced
-            "adb_path": self.adb_path.text().strip(),
+            "adb_path": self._text_cache["adb_path"],
             "adb_timeout": self.adb_timeout.value(),
-            "install_flags": self.install_flags.text().strip(),
+            "install_flags": self._text_cache["install_flags"],
             "cache_search_results": self.cache_search_results.isChecked(),
             "cache_duration": self.cache_duration.value(),
             "log_level": self.log_level.currentText(),
@@ -441,15 +479,17 @@ class SettingsDialog(QDialog):
         
         # Create temporary API client with current settings
         temp_client = APIClient()
-        temp_client.base_url = self.server_url.text().strip()
-        temp_client.headers["Authorization"] = f"Bearer {self.api_token.text().strip()}"
+        temp_client.base_url = self._text_cache["server_url"]
+        temp_client.headers["Authorization"] = f"Bearer {self._text_cache['api_token']}"
         
         def test_async():
             try:
                 loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
                 
-                healthy = loop.run_until_complete(temp_client.health_check())
+                try:
+                    healthy = loop.run_until_complete(temp_client.health_check())
+                finally:
+                    loop.run_until_complete(temp_client.close())
                 
                 if healthy:
                     QMessageBox.information(self, "Connection Test", "✅ Connection successful!")
@@ -464,7 +504,6 @@ class SettingsDialog(QDialog):
         self.test_connection_btn.setEnabled(False)
         self.test_connection_btn.setText("Testing...")
         
-        from PyQt5.QtCore import QTimer
         QTimer.singleShot(100, test_async)
         
         def reset_button():
@@ -516,9 +555,23 @@ class SettingsDialog(QDialog):
             self.test_connection_btn.setIcon(qta.icon('mdi.network', color=colors["white"]))
         if hasattr(self, 'clear_cache_btn'):
             self.clear_cache_btn.setIcon(qta.icon('mdi.delete', color=colors["white"]))
+        if hasattr(self, 'browse_download_action'):
+            self.browse_download_action.setIcon(qta.icon('mdi.folder-open', color=colors["text_secondary"]))
+        if hasattr(self, 'browse_temp_action'):
+            self.browse_temp_action.setIcon(qta.icon('mdi.folder-open', color=colors["text_secondary"]))
     
     def on_theme_changed(self, theme: str):
         """Handle theme change in real-time"""
+        self._pending_theme = theme
+        self._theme_timer.start()
+    
+    def _apply_pending_theme(self):
+        """Apply the most recently selected theme"""
+        theme = self._pending_theme
+        if theme is None:
+            return
+        self._pending_theme = None
+        
         # Save the theme setting immediately
         ClientConfig.set_setting("theme", theme)
         
@@ -3,18 +3,172 @@ UI Inspector for APK Finder Client
 Provides a way to inspect UI elements and their properties
 """
 
-from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTreeWidget, 
-                           QTreeWidgetItem, QTextEdit, QSplitter, QPushButton,
-                           QLabel, QWidget, QFrame, QApplication)
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+import time
+import weakref
+from io import StringIO
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTreeView, 
+                           QTextEdit, QSplitter, QPushButton,
+                           QLabel, QWidget, QFrame, QApplication, QHeaderView)
+from PyQt5.QtCore import Qt, QTimer, QEvent, pyqtSignal, QAbstractItemModel, QModelIndex
 from PyQt5.QtGui import QPalette, QColor, QCursor
 import qtawesome as qta
 from ui.styles import get_complete_style, get_theme_colors
 
+# Appended to a widget's own stylesheet while it is highlighted
+_HIGHLIGHT_SUFFIX = """
+border: 3px solid #FF0000 !important;
+background-color: rgba(255, 0, 0, 0.1) !important;
+"""
+
+
+class WidgetTreeModel(QAbstractItemModel):
+    """Item model exposing a live QWidget hierarchy
+    
+    Child rows are only inserted when a node is expanded (fetchMore), so
+    refreshing the tree costs O(visible rows) rather than O(all widgets).
+    """
+    
+    def __init__(self, root_widget, parent=None):
+        super().__init__(parent)
+        self.root_widget = root_widget
+        self._children = {}
+        self._fetched = set()
+        # Row of each widget within its parent's child list
+        self._rows = weakref.WeakKeyDictionary()
+    
+    def reset(self):
+        """Drop cached child lists and re-read the hierarchy"""
+        self.beginResetModel()
+        self._children.clear()
+        self._fetched.clear()
+        self._rows.clear()
+        self.endResetModel()
+    
+    def child_widgets(self, widget):
+        """Get the direct QWidget children of a widget"""
+        children = self._children.get(widget)
+        if children is None:
+            children = widget.findChildren(QWidget, options=Qt.FindDirectChildrenOnly)
+            self._children[widget] = children
+            for row, child in enumerate(children):
+                self._rows[child] = row
+        return children
+    
+    def widget(self, index):
+        """Get the widget stored in an index"""
+        return index.internalPointer() if index.isValid() else None
+    
+    def index_for_widget(self, widget):
+        """Get the model index of a widget, or an invalid index if not in the tree"""
+        path = []
+        while widget is not None and widget is not self.root_widget:
+            path.append(widget)
+            widget = widget.parentWidget()
+        if widget is None:
+            return QModelIndex()
+        
+        index = self.index(0, 0)
+        parent_widget = self.root_widget
+        for child in reversed(path):
+            if self.canFetchMore(index):
+                self.fetchMore(index)
+            self.child_widgets(parent_widget)
+            row = self._rows.get(child)
+            if row is None:
+                return QModelIndex()
+            index = self.index(row, 0, index)
+            parent_widget = child
+        return index
+    
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, self.root_widget)
+        return self.createIndex(row, column, self.child_widgets(parent.internalPointer())[row])
+    
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        widget = index.internalPointer()
+        if widget is self.root_widget:
+            return QModelIndex()
+        parent_widget = widget.parentWidget()
+        if parent_widget is None:
+            return QModelIndex()
+        if parent_widget is self.root_widget:
+            return self.createIndex(0, 0, self.root_widget)
+        return self.createIndex(self._rows[parent_widget], 0, parent_widget)
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        if not parent.isValid():
+            return 1 if self.root_widget is not None else 0
+        widget = parent.internalPointer()
+        return len(self._children[widget]) if widget in self._fetched else 0
+    
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return self.root_widget is not None
+        widget = parent.internalPointer()
+        if widget in self._fetched:
+            return bool(self._children[widget])
+        return widget.findChild(QWidget, options=Qt.FindDirectChildrenOnly) is not None
+    
+    def canFetchMore(self, parent):
+        return parent.isValid() and parent.internalPointer() not in self._fetched
+    
+    def fetchMore(self, parent):
+        if not self.canFetchMore(parent):
+            return
+        widget = parent.internalPointer()
+        children = self.child_widgets(widget)
+        if not children:
+            self._fetched.add(widget)
+            return
+        self.beginInsertRows(parent, 0, len(children) - 1)
+        self._fetched.add(widget)
+        self.endInsertRows()
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return "Widget Hierarchy"
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        widget = index.internalPointer()
+        if role == Qt.UserRole:
+            return widget
+        if role != Qt.DisplayRole:
+            return None
+        
+        if widget is self.root_widget:
+            return widget.__class__.__name__
+        
+        # Widget info
+        text = widget.text() if hasattr(widget, 'text') else ""
+        object_name = widget.objectName()
+        
+        parts = [widget.__class__.__name__]
+        if object_name:
+            parts.append(f"({object_name})")
+        if text:
+            parts.append(f'"{text[:20]}{"..." if len(text) > 20 else ""}"')
+        return " ".join(parts)
+
 
 class UIInspector(QDialog):
     """UI Inspector dialog for debugging UI elements"""
     
+    # Emitted with the widget selected in the tree or by inspection click
+    widget_selected = pyqtSignal(object)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("UI Inspector")
@@ -28,6 +182,24 @@ class UIInspector(QDialog):
         self.inspection_mode = False
         self.highlighted_widget = None
         self.original_stylesheet = {}
+        # Last (time, cursor position, widget) hit-test result
+        self._last_hit = (0.0, None, None)
+        
+        # Single timer that clears the current highlight after 3 seconds
+        self._pending_highlight = None
+        self._highlight_timer = QTimer(self)
+        self._highlight_timer.setSingleShot(True)
+        self._highlight_timer.timeout.connect(self._on_highlight_timeout)
+        
+        # Properties are formatted after the click has been handled and painted
+        self._pending_props = None
+        self._props_timer = QTimer(self)
+        self._props_timer.setSingleShot(True)
+        self._props_timer.setInterval(0)
+        self._props_timer.timeout.connect(self._on_props_timeout)
+        
+        self.widget_selected.connect(self.queue_widget_properties)
+        self.widget_selected.connect(self.highlight_widget)
         
         self.init_ui()
         
@@ -68,9 +240,14 @@ class UIInspector(QDialog):
         splitter = QSplitter(Qt.Horizontal)
         
         # Widget tree
-        self.tree_widget = QTreeWidget()
-        self.tree_widget.setHeaderLabel("Widget Hierarchy")
-        self.tree_widget.itemClicked.connect(self.on_item_clicked)
+        self.tree_model = WidgetTreeModel(self.parent(), self)
+        self.tree_widget = QTreeView()
+        self.tree_widget.setModel(self.tree_model)
+        self.tree_widget.setUniformRowHeights(True)
+        self.tree_widget.setAlternatingRowColors(False)
+        self.tree_widget.setAnimated(False)
+        self.tree_widget.header().setSectionResizeMode(QHeaderView.Fixed)
+        self.tree_widget.clicked.connect(self.on_item_clicked)
         self.tree_widget.setMinimumWidth(300)
         splitter.addWidget(self.tree_widget)
         
@@ -104,97 +281,88 @@ class UIInspector(QDialog):
         
     def refresh_tree(self):
         """Refresh the widget tree"""
-        self.tree_widget.clear()
-        
-        if self.parent():
-            root_item = QTreeWidgetItem(self.tree_widget)
-            root_item.setText(0, f"{self.parent().__class__.__name__}")
-            root_item.setData(0, Qt.UserRole, self.parent())
+        self.tree_widget.setUpdatesEnabled(False)
+        self.tree_widget.blockSignals(True)
+        try:
+            self.tree_model.reset()
             
-            self.populate_tree(self.parent(), root_item)
-            self.tree_widget.expandAll()
+            # Only open the root; deeper levels are read when the user expands them
+            if self.parent():
+                self.tree_widget.expand(self.tree_model.index(0, 0))
+        finally:
+            self.tree_widget.blockSignals(False)
+            self.tree_widget.setUpdatesEnabled(True)
+            self.tree_widget.viewport().update()
             
         self.status_label.setText("Tree refreshed")
         
-    def populate_tree(self, widget, parent_item):
-        """Recursively populate the widget tree"""
-        children = widget.findChildren(QWidget)
-        direct_children = [child for child in children if child.parent() == widget]
-        
-        for child in direct_children:
-            item = QTreeWidgetItem(parent_item)
-            
-            # Widget info
-            class_name = child.__class__.__name__
-            object_name = child.objectName() or "unnamed"
-            text = child.text() if hasattr(child, 'text') and child.text() else ""
-            
-            display_text = f"{class_name}"
-            if object_name != "unnamed":
-                display_text += f" ({object_name})"
-            if text:
-                display_text += f' "{text[:20]}..."' if len(text) > 20 else f' "{text}"'
-                
-            item.setText(0, display_text)
-            item.setData(0, Qt.UserRole, child)
-            
-            # Recursively add children
-            self.populate_tree(child, item)
-            
-    def on_item_clicked(self, item):
+    def on_item_clicked(self, index):
         """Handle tree item click"""
-        widget = item.data(0, Qt.UserRole)
+        widget = self.tree_model.widget(index)
         if widget:
+            self.widget_selected.emit(widget)
+            
+    def queue_widget_properties(self, widget):
+        """Show a placeholder and format the widget's properties on the next loop turn"""
+        self.props_text.setPlainText("Loading...")
+        self._pending_props = weakref.ref(widget)
+        self._props_timer.start()
+            
+    def _on_props_timeout(self):
+        """Show properties of the most recently selected widget"""
+        widget = self._pending_props() if self._pending_props else None
+        self._pending_props = None
+        if widget is not None:
             self.show_widget_properties(widget)
-            self.highlight_widget(widget)
             
     def show_widget_properties(self, widget):
         """Show properties of the selected widget"""
-        props = []
+        buf = StringIO()
+        w = buf.write
         
         # Basic properties
-        props.append(f"Class: {widget.__class__.__name__}")
-        props.append(f"Object Name: {widget.objectName() or 'None'}")
-        props.append(f"Visible: {widget.isVisible()}")
-        props.append(f"Enabled: {widget.isEnabled()}")
-        props.append(f"Geometry: {widget.geometry()}")
-        props.append(f"Size: {widget.size()}")
-        props.append(f"Minimum Size: {widget.minimumSize()}")
-        props.append(f"Maximum Size: {widget.maximumSize()}")
+        w(f"Class: {widget.__class__.__name__}\n")
+        w(f"Object Name: {widget.objectName() or 'None'}\n")
+        w(f"Visible: {widget.isVisible()}\n")
+        w(f"Enabled: {widget.isEnabled()}\n")
+        w(f"Geometry: {widget.geometry()}\n")
+        w(f"Size: {widget.size()}\n")
+        w(f"Minimum Size: {widget.minimumSize()}\n")
+        w(f"Maximum Size: {widget.maximumSize()}\n")
         
         # Text properties
         if hasattr(widget, 'text'):
-            props.append(f"Text: {widget.text()}")
+            w(f"Text: {widget.text()}\n")
         if hasattr(widget, 'placeholderText'):
-            props.append(f"Placeholder: {widget.placeholderText()}")
+            w(f"Placeholder: {widget.placeholderText()}\n")
             
         # Style properties
-        props.append(f"StyleSheet: {widget.styleSheet()[:200]}..." if len(widget.styleSheet()) > 200 else f"StyleSheet: {widget.styleSheet()}")
+        style_sheet = widget.styleSheet()
+        w(f"StyleSheet: {style_sheet[:200]}{'...' if len(style_sheet) > 200 else ''}\n")
         
         # Parent/children info
-        props.append(f"Parent: {widget.parent().__class__.__name__ if widget.parent() else 'None'}")
-        children = widget.findChildren(QWidget)
-        direct_children = [child for child in children if child.parent() == widget]
-        props.append(f"Direct Children: {len(direct_children)}")
+        parent = widget.parent()
+        w(f"Parent: {parent.__class__.__name__ if parent else 'None'}\n")
+        w(f"Direct Children: {len(self.tree_model.child_widgets(widget))}\n")
         
         # Layout info
-        if widget.layout():
-            props.append(f"Layout: {widget.layout().__class__.__name__}")
+        layout = widget.layout()
+        if layout:
+            w(f"Layout: {layout.__class__.__name__}\n")
             
         # Window flags
         if widget.isWindow():
-            props.append(f"Window Flags: {widget.windowFlags()}")
+            w(f"Window Flags: {widget.windowFlags()}\n")
             
         # Background color
-        palette = widget.palette()
-        bg_color = palette.color(QPalette.Window)
-        props.append(f"Background Color: {bg_color.name()}")
+        bg_color = widget.palette().color(QPalette.Window)
+        w(f"Background Color: {bg_color.name()}\n")
         
         # Font info
         font = widget.font()
-        props.append(f"Font: {font.family()}, {font.pointSize()}pt")
+        w(f"Font: {font.family()}, {font.pointSize()}pt")
         
-        self.props_text.setPlainText("\\n".join(props))
+        self.props_text.setPlainText(buf.getvalue())
         
     def highlight_widget(self, widget):
         """Highlight the selected widget"""
@@ -207,26 +375,31 @@ class UIInspector(QDialog):
         self.add_highlight(widget)
         
         # Auto-remove highlight after 3 seconds
-        QTimer.singleShot(3000, lambda: self.remove_highlight(widget))
+        self._pending_highlight = weakref.ref(widget)
+        self._highlight_timer.start(3000)
+        
+    def _on_highlight_timeout(self):
+        """Remove the pending highlight if its widget still exists"""
+        widget = self._pending_highlight() if self._pending_highlight else None
+        self._pending_highlight = None
+        if widget is not None and widget in self.original_stylesheet:
+            self.remove_highlight(widget)
         
     def add_highlight(self, widget):
         """Add highlight to widget"""
         if widget not in self.original_stylesheet:
             self.original_stylesheet[widget] = widget.styleSheet()
             
-        highlight_style = """
-        border: 3px solid #FF0000 !important;
-        background-color: rgba(255, 0, 0, 0.1) !important;
-        """
-        
-        current_style = self.original_stylesheet[widget]
-        widget.setStyleSheet(current_style + highlight_style)
+        new_style = self.original_stylesheet[widget] + _HIGHLIGHT_SUFFIX
+        if widget.styleSheet() != new_style:
+            widget.setStyleSheet(new_style)
         
     def remove_highlight(self, widget):
         """Remove highlight from widget"""
         if widget in self.original_stylesheet:
-            widget.setStyleSheet(self.original_stylesheet[widget])
-            del self.original_stylesheet[widget]
+            original_style = self.original_stylesheet.pop(widget)
+            if widget.styleSheet() != original_style:
+                widget.setStyleSheet(original_style)
             
     def toggle_inspection(self):
         """Toggle inspection mode"""
@@ -237,9 +410,8 @@ class UIInspector(QDialog):
             self.inspect_btn.setIcon(qta.icon('mdi.stop', color='white'))
             self.status_label.setText("Inspection mode ON - Click on any widget to inspect")
             
-            # Install event filter on parent window
-            if self.parent():
-                self.parent().installEventFilter(self)
+            # Install event filter on the application to see clicks on any window
+            QApplication.instance().installEventFilter(self)
                 
         else:
             self.inspect_btn.setText("Start Inspection")
@@ -247,51 +419,62 @@ class UIInspector(QDialog):
             self.status_label.setText("Inspection mode OFF")
             
             # Remove event filter
-            if self.parent():
-                self.parent().removeEventFilter(self)
+            QApplication.instance().removeEventFilter(self)
                 
     def eventFilter(self, obj, event):
         """Event filter for inspection mode"""
-        if self.inspection_mode and event.type() == event.MouseButtonPress:
-            if event.button() == Qt.LeftButton:
-                # Get widget under cursor
-                pos = QCursor.pos()
+        if not self.inspection_mode or event.type() != QEvent.MouseButtonPress:
+            return False
+        
+        if event.button() == Qt.LeftButton:
+            # Get widget under cursor, reusing the last hit-test for the same spot
+            pos = QCursor.pos()
+            now = time.monotonic()
+            last_time, last_pos, widget = self._last_hit
+            if pos != last_pos or now - last_time > 0.05:
                 widget = QApplication.widgetAt(pos)
-                
-                if widget and widget != self:
-                    # Find the widget in the tree and select it
-                    self.find_and_select_widget(widget)
-                    return True
+                self._last_hit = (now, pos, widget)
+            
+            # Let clicks inside the inspector itself through
+            if widget and widget.window() is not self:
+                # Find the widget in the tree and select it
+                self.find_and_select_widget(widget)
+                return True
                     
         return super().eventFilter(obj, event)
         
     def find_and_select_widget(self, target_widget):
         """Find and select a widget in the tree"""
-        def search_item(item):
-            widget = item.data(0, Qt.UserRole)
-            if widget == target_widget:
-                self.tree_widget.setCurrentItem(item)
-                self.on_item_clicked(item)
-                return True
-                
-            for i in range(item.childCount()):
-                if search_item(item.child(i)):
-                    return True
-            return False
-            
-        root = self.tree_widget.invisibleRootItem()
-        for i in range(root.childCount()):
-            if search_item(root.child(i)):
-                break
+        index = self.tree_model.index_for_widget(target_widget)
+        if index.isValid():
+            self.tree_widget.setCurrentIndex(index)
+            self.tree_widget.scrollTo(index)
+            self.on_item_clicked(index)
                 
+    def hideEvent(self, event):
+        """Stop inspecting when hidden by hide(), Esc or close
+        
+        The event filter sits on the whole application, so leaving it installed
+        would keep swallowing left clicks in every window.
+        """
+        if self.inspection_mode:
+            self.toggle_inspection()
+        super().hideEvent(event)
+        
     def closeEvent(self, event):
         """Handle close event"""
-        # Clean up highlights
-        for widget in list(self.original_stylesheet.keys()):
-            self.remove_highlight(widget)
+        # Clean up highlights with repaints suspended on the inspected window
+        top_window = self.parent().window() if self.parent() else None
+        if top_window:
+            top_window.setUpdatesEnabled(False)
+        try:
+            for widget in list(self.original_stylesheet.keys()):
+                self.remove_highlight(widget)
+        finally:
+            if top_window:
+                top_window.setUpdatesEnabled(True)
             
         # Remove event filter
-        if self.parent():
-            self.parent().removeEventFilter(self)
+        QApplication.instance().removeEventFilter(self)
             
         event.accept()
\ No newline at end of file
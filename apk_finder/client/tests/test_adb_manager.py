@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+import threading
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from adb_manager import ADBManager
+
+
+class ShellLinesTest(unittest.TestCase):
+    """Run _shell_lines against a local sh standing in for `adb shell`"""
+    
+    def setUp(self):
+        self.shell = subprocess.Popen(["sh"], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                      stderr=subprocess.STDOUT)
+        self.manager = ADBManager()
+        self.manager._shell_sessions[""] = self.shell
+        patcher = mock.patch.object(ADBManager, "_get_session",
+                                    return_value=(self.shell, threading.Lock()))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.manager.close_sessions)
+    
+    def test_output_with_trailing_newline(self):
+        self.assertEqual(self.manager._shell_lines(None, "echo foo", timeout=5), (0, [b"foo"]))
+    
+    def test_output_without_trailing_newline(self):
+        self.assertEqual(self.manager._shell_lines(None, "printf foo", timeout=5), (0, [b"foo"]))
+        # The session is still usable afterwards
+        self.assertEqual(self.manager._shell_lines(None, "printf bar; false", timeout=5), (1, [b"bar"]))
+    
+    def test_prefix_filter_applies_to_unterminated_line(self):
+        command = "printf 'package:a\\nother\\npackage:b'"
+        self.assertEqual(self.manager._shell_lines(None, command, timeout=5, prefix=b"package:"),
+                         (0, [b"package:a", b"package:b"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
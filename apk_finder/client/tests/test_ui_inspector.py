@@ -0,0 +1,62 @@
+import os
+import sys
+import unittest
+
+_CLIENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _CLIENT_DIR)
+sys.path.insert(0, os.path.join(_CLIENT_DIR, "src"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PyQt5.QtCore import QEvent
+    from PyQt5.QtWidgets import QApplication, QWidget
+    from ui_inspector import UIInspector
+except ImportError:  # PyQt5/qtawesome not installed
+    UIInspector = None
+
+
+@unittest.skipIf(UIInspector is None, "PyQt5 and qtawesome are required")
+class InspectionFilterTest(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication([])
+        self.window = QWidget()
+        self.filtered = []
+        
+        test = self
+        
+        class CountingInspector(UIInspector):
+            def eventFilter(self, obj, event):
+                test.filtered.append(event.type())
+                return super().eventFilter(obj, event)
+        
+        self.inspector = CountingInspector(self.window)
+        self.addCleanup(self.window.deleteLater)
+    
+    def _filter_installed(self):
+        del self.filtered[:]
+        QApplication.sendEvent(self.window, QEvent(QEvent.User))
+        return QEvent.User in self.filtered
+    
+    def test_hide_while_inspecting_removes_filter(self):
+        self.inspector.show()
+        self.inspector.toggle_inspection()
+        self.assertTrue(self._filter_installed())
+        
+        self.inspector.hide()
+        
+        self.assertFalse(self.inspector.inspection_mode)
+        self.assertEqual(self.inspector.inspect_btn.text(), "Start Inspection")
+        self.assertFalse(self._filter_installed())
+    
+    def test_reject_while_inspecting_removes_filter(self):
+        self.inspector.show()
+        self.inspector.toggle_inspection()
+        
+        self.inspector.reject()  # Esc
+        
+        self.assertFalse(self.inspector.inspection_mode)
+        self.assertFalse(self._filter_installed())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,8 +2,12 @@
 Modern UI Styles for APK Finder Client
 """
 
+from functools import lru_cache
+from string import Template
+from types import MappingProxyType
+
 # Light Theme Colors
-LIGHT_COLORS = {
+LIGHT_COLORS = MappingProxyType({
     "primary": "#3B82F6",      # Blue
     "primary_hover": "#2563EB",
     "secondary": "#8B5CF6",    # Purple
@@ -19,10 +23,10 @@ LIGHT_COLORS = {
     "warning": "#F59E0B",
     "error": "#EF4444",
     "white": "#FFFFFF"
-}
+})
 
 # Dark Theme Colors
-DARK_COLORS = {
+DARK_COLORS = MappingProxyType({
     "primary": "#3B82F6",      # Blue
     "primary_hover": "#2563EB",
     "secondary": "#8B5CF6",    # Purple
@@ -38,10 +42,10 @@ DARK_COLORS = {
     "warning": "#F59E0B",
     "error": "#EF4444",
     "white": "#FFFFFF"
-}
+})
 
-# Default to light theme
-COLORS = LIGHT_COLORS.copy()
+# Current palette; rebound by update_colors, so read it as styles.COLORS
+COLORS = LIGHT_COLORS
 
 def get_theme_colors(theme: str = "Light"):
     """Get color palette for the specified theme"""
@@ -51,619 +55,612 @@ def get_theme_colors(theme: str = "Light"):
         return LIGHT_COLORS
 
 def update_colors(theme: str = "Light"):
-    """Update global COLORS dictionary with theme colors"""
+    """Point the global COLORS palette at the theme colors"""
     global COLORS
-    COLORS.clear()
-    COLORS.update(get_theme_colors(theme))
+    COLORS = get_theme_colors(theme)
 
 
-def get_complete_style(theme: str = "Light"):
-    """Get complete stylesheet for the specified theme"""
-    colors = get_theme_colors(theme)
+# Base QPushButton rules, shared by the complete stylesheet and BUTTON_STYLE
+_BUTTON_QSS = """
+    QPushButton {
+        background-color: $primary;
+        color: $white;
+        border: none;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-weight: 500;
+        font-size: 14px;
+    }
     
-    # Main Application Style
-    main_style = f"""
-    QMainWindow {{
-        background-color: {colors["background"]};
-        color: {colors["text_primary"]};
+    QPushButton:hover {
+        background-color: $primary_hover;
+    }
+    
+    QPushButton:pressed {
+        background-color: $primary_hover;
+        border: 1px solid $primary_hover;
+    }
+    
+    QPushButton:disabled {
+        background-color: $text_muted;
+        color: $white;
+    }
+    
+"""
+
+
+# Complete stylesheet; $name placeholders are keys of the theme palettes
+_QSS_TEMPLATE = Template("""
+    /* Main Application Style */
+    QMainWindow {
+        background-color: $background;
+        color: $text_primary;
         font-family: "Segoe UI", "Microsoft YaHei", Arial, sans-serif;
         font-size: 14px;
-    }}
+    }
     
     /* Central widget - force background color */
-    QWidget#centralWidget {{
-        background-color: {colors["background"]};
-        color: {colors["text_primary"]};
-    }}
+    QWidget#centralWidget {
+        background-color: $background;
+        color: $text_primary;
+    }
     
     /* Default QWidget styling */
-    QWidget {{
-        background-color: {colors["background"]};
-        color: {colors["text_primary"]};
-    }}
+    QWidget {
+        background-color: $background;
+        color: $text_primary;
+    }
     
     /* Make sure specific widgets use appropriate backgrounds */
-    QTabWidget QWidget {{
+    QTabWidget QWidget {
         background-color: transparent;
-    }}
+    }
     
-    QGroupBox QWidget {{
+    QGroupBox QWidget {
         background-color: transparent;
-    }}
+    }
     
-    QScrollArea {{
-        background-color: {colors["background"]};
+    QScrollArea {
+        background-color: $background;
         border: none;
-    }}
+    }
     
-    QScrollArea > QWidget > QWidget {{
-        background-color: {colors["background"]};
-    }}
+    QScrollArea > QWidget > QWidget {
+        background-color: $background;
+    }
     
-    QSplitter {{
-        background-color: {colors["background"]};
-    }}
+    QSplitter {
+        background-color: $background;
+    }
     
-    QSplitter::handle {{
-        background-color: {colors["border"]};
-    }}
+    QSplitter::handle {
+        background-color: $border;
+    }
     
-    QFrame {{
-        background-color: {colors["background"]};
-    }}
-    """
+    QFrame {
+        background-color: $background;
+    }
     
-    # Tab Widget Style
-    tab_style = f"""
-    QTabWidget::pane {{
-        border: 1px solid {colors["border"]};
+    /* Tab Widget Style */
+    QTabWidget::pane {
+        border: 1px solid $border;
         border-radius: 8px;
-        background-color: {colors["surface"]};
+        background-color: $surface;
         margin-top: 5px;
-    }}
+    }
     
-    QTabWidget::tab-bar {{
+    QTabWidget::tab-bar {
         alignment: left;
-    }}
+    }
     
-    QTabBar::tab {{
-        background-color: {colors["background"]};
-        color: {colors["text_secondary"]};
-        border: 1px solid {colors["border"]};
+    QTabBar::tab {
+        background-color: $background;
+        color: $text_secondary;
+        border: 1px solid $border;
         border-bottom: none;
         padding: 10px 20px;
         margin-right: 2px;
         border-top-left-radius: 8px;
         border-top-right-radius: 8px;
         font-weight: 500;
-    }}
-    
-    QTabBar::tab:selected {{
-        background-color: {colors["primary"]};
-        color: {colors["white"]};
-        border-color: {colors["primary"]};
-    }}
-    
-    QTabBar::tab:hover:!selected {{
-        background-color: {colors["surface_hover"]};
-        color: {colors["text_primary"]};
-    }}
-    """
-    
-    # Button Styles
-    button_style = f"""
-    QPushButton {{
-        background-color: {colors["primary"]};
-        color: {colors["white"]};
-        border: none;
-        border-radius: 6px;
-        padding: 8px 16px;
-        font-weight: 500;
-        font-size: 14px;
-    }}
-    
-    QPushButton:hover {{
-        background-color: {colors["primary_hover"]};
-    }}
-    
-    QPushButton:pressed {{
-        background-color: {colors["primary_hover"]};
-        border: 1px solid {colors["primary_hover"]};
-    }}
-    
-    QPushButton:disabled {{
-        background-color: {colors["text_muted"]};
-        color: {colors["white"]};
-    }}
-    
-    QPushButton#primaryButton {{
-        background-color: {colors["primary"]};
-        color: {colors["white"]};
-    }}
-    
-    QPushButton#primaryButton:hover {{
-        background-color: {colors["primary_hover"]};
-    }}
-    
-    QPushButton#secondaryButton {{
-        background-color: {colors["secondary"]};
-        color: {colors["white"]};
-    }}
-    
-    QPushButton#secondaryButton:hover {{
-        background-color: {colors["secondary_hover"]};
-    }}
-    
-    QPushButton#outlineButton {{
-        background-color: {colors["surface"]};
-        color: {colors["primary"]};
-        border: 2px solid {colors["primary"]};
-    }}
-    
-    QPushButton#outlineButton:hover {{
-        background-color: {colors["primary"]};
-        color: {colors["white"]};
-    }}
-    
-    QPushButton#serverButton {{
-        background-color: {colors["surface"]};
-        color: {colors["text_primary"]};
-        border: 2px solid {colors["border"]};
+    }
+    
+    QTabBar::tab:selected {
+        background-color: $primary;
+        color: $white;
+        border-color: $primary;
+    }
+    
+    QTabBar::tab:hover:!selected {
+        background-color: $surface_hover;
+        color: $text_primary;
+    }
+    
+    /* Button Styles */
+""" + _BUTTON_QSS + """
+    QPushButton#primaryButton {
+        background-color: $primary;
+        color: $white;
+    }
+    
+    QPushButton#primaryButton:hover {
+        background-color: $primary_hover;
+    }
+    
+    QPushButton#secondaryButton {
+        background-color: $secondary;
+        color: $white;
+    }
+    
+    QPushButton#secondaryButton:hover {
+        background-color: $secondary_hover;
+    }
+    
+    QPushButton#outlineButton {
+        background-color: $surface;
+        color: $primary;
+        border: 2px solid $primary;
+    }
+    
+    QPushButton#outlineButton:hover {
+        background-color: $primary;
+        color: $white;
+    }
+    
+    QPushButton#serverButton {
+        background-color: $surface;
+        color: $text_primary;
+        border: 2px solid $border;
         border-radius: 6px;
         padding: 8px 16px;
         font-weight: 500;
         font-size: 14px;
         min-width: 100px;
-    }}
-    
-    QPushButton#serverButton:hover {{
-        background-color: {colors["surface_hover"]};
-        border-color: {colors["primary"]};
-    }}
-    
-    QPushButton#serverButton:checked {{
-        background-color: {colors["primary"]};
-        color: {colors["white"]};
-        border-color: {colors["primary"]};
-    }}
-    
-    QPushButton#serverButton:checked:hover {{
-        background-color: {colors["primary_hover"]};
-        border-color: {colors["primary_hover"]};
-    }}
-    
-    QPushButton#buildTypeButton {{
-        background-color: {colors["surface"]};
-        color: {colors["text_primary"]};
-        border: 2px solid {colors["border"]};
+    }
+    
+    QPushButton#serverButton:hover {
+        background-color: $surface_hover;
+        border-color: $primary;
+    }
+    
+    QPushButton#serverButton:checked {
+        background-color: $primary;
+        color: $white;
+        border-color: $primary;
+    }
+    
+    QPushButton#serverButton:checked:hover {
+        background-color: $primary_hover;
+        border-color: $primary_hover;
+    }
+    
+    QPushButton#buildTypeButton {
+        background-color: $surface;
+        color: $text_primary;
+        border: 2px solid $border;
         border-radius: 6px;
         padding: 8px 16px;
         font-weight: 500;
         font-size: 14px;
         min-width: 80px;
-    }}
-    
-    QPushButton#buildTypeButton:hover {{
-        background-color: {colors["surface_hover"]};
-        border-color: {colors["secondary"]};
-    }}
-    
-    QPushButton#buildTypeButton:checked {{
-        background-color: {colors["secondary"]};
-        color: {colors["white"]};
-        border-color: {colors["secondary"]};
-    }}
-    
-    QPushButton#buildTypeButton:checked:hover {{
-        background-color: {colors["secondary_hover"]};
-        border-color: {colors["secondary_hover"]};
-    }}
-    """
-    
-    # Search Input Style
-    search_input_style = f"""
-    QLineEdit {{
-        background-color: {colors["background"]};
-        border: 2px solid {colors["border"]};
+    }
+    
+    QPushButton#buildTypeButton:hover {
+        background-color: $surface_hover;
+        border-color: $secondary;
+    }
+    
+    QPushButton#buildTypeButton:checked {
+        background-color: $secondary;
+        color: $white;
+        border-color: $secondary;
+    }
+    
+    QPushButton#buildTypeButton:checked:hover {
+        background-color: $secondary_hover;
+        border-color: $secondary_hover;
+    }
+    
+    /* Search Input Style */
+    QLineEdit {
+        background-color: $background;
+        border: 2px solid $border;
         border-radius: 8px;
         padding: 12px 16px;
         font-size: 14px;
-        color: {colors["text_primary"]};
-    }}
+        color: $text_primary;
+    }
     
-    QLineEdit:focus {{
-        border-color: {colors["primary"]};
+    QLineEdit:focus {
+        border-color: $primary;
         outline: none;
-    }}
-    
-    QLineEdit::placeholder {{
-        color: {colors["text_muted"]};
-    }}
-    """
-    
-    # Table Widget Style
-    table_style = f"""
-    QTableWidget {{
-        background-color: {colors["background"]};
-        border: 1px solid {colors["border"]};
+    }
+    
+    QLineEdit::placeholder {
+        color: $text_muted;
+    }
+    
+    /* Table Widget Style */
+    QTableWidget {
+        background-color: $background;
+        border: 1px solid $border;
         border-radius: 8px;
-        gridline-color: {colors["border"]};
-        selection-background-color: {colors["primary"]};
-        selection-color: {colors["white"]};
+        gridline-color: $border;
+        selection-background-color: $primary;
+        selection-color: $white;
         font-size: 13px;
-    }}
+    }
     
-    QTableWidget::item {{
+    QTableWidget::item {
         padding: 12px 8px;
-        border-bottom: 1px solid {colors["border"]};
-    }}
+        border-bottom: 1px solid $border;
+    }
     
-    QTableWidget::item:selected {{
-        background-color: {colors["primary"]};
-        color: {colors["white"]};
-    }}
+    QTableWidget::item:selected {
+        background-color: $primary;
+        color: $white;
+    }
     
-    QTableWidget::item:hover {{
-        background-color: {colors["surface_hover"]};
-    }}
+    QTableWidget::item:hover {
+        background-color: $surface_hover;
+    }
     
-    QHeaderView::section {{
-        background-color: {colors["surface"]};
-        color: {colors["text_primary"]};
+    QHeaderView::section {
+        background-color: $surface;
+        color: $text_primary;
         padding: 12px 8px;
         border: none;
-        border-bottom: 2px solid {colors["border"]};
+        border-bottom: 2px solid $border;
         font-weight: 600;
-    }}
+    }
     
-    QHeaderView::section:hover {{
-        background-color: {colors["surface_hover"]};
-    }}
-    """
+    QHeaderView::section:hover {
+        background-color: $surface_hover;
+    }
     
-    # Scroll Bar Style
-    scrollbar_style = f"""
-    QScrollBar:vertical {{
-        background-color: {colors["surface"]};
+    /* Scroll Bar Style */
+    QScrollBar:vertical {
+        background-color: $surface;
         width: 12px;
         border-radius: 6px;
         margin: 0;
-    }}
+    }
     
-    QScrollBar::handle:vertical {{
-        background-color: {colors["text_muted"]};
+    QScrollBar::handle:vertical {
+        background-color: $text_muted;
         border-radius: 6px;
         min-height: 20px;
         margin: 2px;
-    }}
+    }
     
-    QScrollBar::handle:vertical:hover {{
-        background-color: {colors["text_secondary"]};
-    }}
+    QScrollBar::handle:vertical:hover {
+        background-color: $text_secondary;
+    }
     
     QScrollBar::add-line:vertical,
-    QScrollBar::sub-line:vertical {{
+    QScrollBar::sub-line:vertical {
         height: 0px;
-    }}
+    }
     
-    QScrollBar:horizontal {{
-        background-color: {colors["surface"]};
+    QScrollBar:horizontal {
+        background-color: $surface;
         height: 12px;
         border-radius: 6px;
         margin: 0;
-    }}
+    }
     
-    QScrollBar::handle:horizontal {{
-        background-color: {colors["text_muted"]};
+    QScrollBar::handle:horizontal {
+        background-color: $text_muted;
         border-radius: 6px;
         min-width: 20px;
         margin: 2px;
-    }}
+    }
     
-    QScrollBar::handle:horizontal:hover {{
-        background-color: {colors["text_secondary"]};
-    }}
+    QScrollBar::handle:horizontal:hover {
+        background-color: $text_secondary;
+    }
     
     QScrollBar::add-line:horizontal,
-    QScrollBar::sub-line:horizontal {{
+    QScrollBar::sub-line:horizontal {
         width: 0px;
-    }}
-    """
-    
-    # Status Bar Style
-    status_bar_style = f"""
-    QStatusBar {{
-        background-color: {colors["surface"]};
-        border-top: 1px solid {colors["border"]};
-        color: {colors["text_secondary"]};
+    }
+    
+    /* Status Bar Style */
+    QStatusBar {
+        background-color: $surface;
+        border-top: 1px solid $border;
+        color: $text_secondary;
         font-size: 12px;
         padding: 5px;
-    }}
-    """
+    }
     
-    # Label Styles
-    label_style = f"""
-    QLabel {{
-        color: {colors["text_primary"]};
+    /* Label Styles */
+    QLabel {
+        color: $text_primary;
         font-size: 14px;
-    }}
-    """
-    
-    # Progress Bar Style
-    progress_bar_style = f"""
-    QProgressBar {{
-        background-color: {colors["surface"]};
-        border: 1px solid {colors["border"]};
+    }
+    
+    /* Progress Bar Style */
+    QProgressBar {
+        background-color: $surface;
+        border: 1px solid $border;
         border-radius: 6px;
         text-align: center;
         font-weight: 500;
-        color: {colors["text_primary"]};
-    }}
+        color: $text_primary;
+    }
     
-    QProgressBar::chunk {{
-        background-color: {colors["primary"]};
+    QProgressBar::chunk {
+        background-color: $primary;
         border-radius: 5px;
-    }}
-    """
-    
-    # ComboBox Style
-    combobox_style = f"""
-    QComboBox {{
-        background-color: {colors["background"]};
-        border: 2px solid {colors["border"]};
+    }
+    
+    /* ComboBox Style */
+    QComboBox {
+        background-color: $background;
+        border: 2px solid $border;
         border-radius: 6px;
         padding: 8px 12px;
         font-size: 14px;
-        color: {colors["text_primary"]};
+        color: $text_primary;
         min-width: 120px;
-    }}
+    }
     
-    QComboBox:focus {{
-        border-color: {colors["primary"]};
-    }}
+    QComboBox:focus {
+        border-color: $primary;
+    }
     
-    QComboBox::drop-down {{
+    QComboBox::drop-down {
         border: none;
         width: 20px;
-    }}
+    }
     
-    QComboBox::down-arrow {{
+    QComboBox::down-arrow {
         image: none;
         border-left: 5px solid transparent;
         border-right: 5px solid transparent;
-        border-top: 5px solid {colors["text_secondary"]};
+        border-top: 5px solid $text_secondary;
         margin-right: 5px;
-    }}
+    }
     
-    QComboBox QAbstractItemView {{
-        background-color: {colors["background"]};
-        border: 1px solid {colors["border"]};
+    QComboBox QAbstractItemView {
+        background-color: $background;
+        border: 1px solid $border;
         border-radius: 6px;
-        selection-background-color: {colors["primary"]};
-        selection-color: {colors["white"]};
+        selection-background-color: $primary;
+        selection-color: $white;
         outline: none;
-    }}
-    """
-    
-    # Menu Style
-    menu_style = f"""
-    QMenu {{
-        background-color: {colors["background"]};
-        border: 1px solid {colors["border"]};
+    }
+    
+    /* Menu Style */
+    QMenu {
+        background-color: $background;
+        border: 1px solid $border;
         border-radius: 8px;
         padding: 5px;
-        color: {colors["text_primary"]};
-    }}
+        color: $text_primary;
+    }
     
-    QMenu::item {{
+    QMenu::item {
         background-color: transparent;
         padding: 8px 16px;
         border-radius: 4px;
         margin: 1px;
-    }}
+    }
     
-    QMenu::item:selected {{
-        background-color: {colors["primary"]};
-        color: {colors["white"]};
-    }}
+    QMenu::item:selected {
+        background-color: $primary;
+        color: $white;
+    }
     
-    QMenu::item:disabled {{
-        color: {colors["text_muted"]};
-    }}
+    QMenu::item:disabled {
+        color: $text_muted;
+    }
     
-    QMenu::separator {{
+    QMenu::separator {
         height: 1px;
-        background-color: {colors["border"]};
+        background-color: $border;
         margin: 5px;
-    }}
-    """
-    
-    # Group Box Style
-    groupbox_style = f"""
-    QGroupBox {{
-        background-color: {colors["surface"]};
-        border: 1px solid {colors["border"]};
+    }
+    
+    /* Group Box Style */
+    QGroupBox {
+        background-color: $surface;
+        border: 1px solid $border;
         border-radius: 8px;
         margin-top: 10px;
         padding-top: 10px;
         font-weight: 600;
-        color: {colors["text_primary"]};
-    }}
+        color: $text_primary;
+    }
     
-    QGroupBox::title {{
+    QGroupBox::title {
         subcontrol-origin: margin;
         subcontrol-position: top left;
         padding: 0 8px;
-        background-color: {colors["surface"]};
+        background-color: $surface;
         margin-left: 10px;
-    }}
+    }
     
-    QTextEdit {{
-        background-color: {colors["background"]};
-        border: 1px solid {colors["border"]};
+    QTextEdit {
+        background-color: $background;
+        border: 1px solid $border;
         border-radius: 6px;
         padding: 8px;
-        color: {colors["text_primary"]};
+        color: $text_primary;
         font-size: 13px;
-    }}
+    }
     
-    QTextEdit:focus {{
-        border-color: {colors["primary"]};
-    }}
+    QTextEdit:focus {
+        border-color: $primary;
+    }
     
-    QCheckBox {{
-        color: {colors["text_primary"]};
+    QCheckBox {
+        color: $text_primary;
         font-size: 14px;
-    }}
+    }
     
-    QCheckBox::indicator {{
+    QCheckBox::indicator {
         width: 18px;
         height: 18px;
-        border: 2px solid {colors["border"]};
+        border: 2px solid $border;
         border-radius: 3px;
-        background-color: {colors["background"]};
-    }}
+        background-color: $background;
+    }
     
-    QCheckBox::indicator:checked {{
-        background-color: {colors["primary"]};
-        border-color: {colors["primary"]};
-    }}
+    QCheckBox::indicator:checked {
+        background-color: $primary;
+        border-color: $primary;
+    }
     
-    QSpinBox {{
-        background-color: {colors["background"]};
-        border: 2px solid {colors["border"]};
+    QSpinBox {
+        background-color: $background;
+        border: 2px solid $border;
         border-radius: 6px;
         padding: 6px 8px;
         font-size: 14px;
-        color: {colors["text_primary"]};
-    }}
-    
-    QSpinBox:focus {{
-        border-color: {colors["primary"]};
-    }}
-    """
-    
-    return f"""
-    {main_style}
-    {tab_style}
-    {button_style}
-    {search_input_style}
-    {table_style}
-    {scrollbar_style}
-    {status_bar_style}
-    {label_style}
-    {progress_bar_style}
-    {combobox_style}
-    {menu_style}
-    {groupbox_style}
-    """
+        color: $text_primary;
+    }
+    
+    QSpinBox:focus {
+        border-color: $primary;
+    }
+    """)
 
-# Generate style constants for backward compatibility
-def _generate_style_constants(theme: str = "Light"):
-    """Generate style constants for the given theme"""
+
+def _build_complete_style(theme: str):
+    """Render the complete stylesheet for a theme"""
     colors = get_theme_colors(theme)
-    
-    # Button Styles
-    button_style = f"""
-    QPushButton {{
-        background-color: {colors["primary"]};
-        color: {colors["white"]};
-        border: none;
-        border-radius: 6px;
-        padding: 8px 16px;
-        font-weight: 500;
-        font-size: 14px;
-    }}
-    
-    QPushButton:hover {{
-        background-color: {colors["primary_hover"]};
-    }}
-    
-    QPushButton:pressed {{
-        background-color: {colors["primary_hover"]};
-        border: 1px solid {colors["primary_hover"]};
-    }}
-    
-    QPushButton:disabled {{
-        background-color: {colors["text_muted"]};
-        color: {colors["white"]};
-    }}
-    """
-    
-    secondary_button_style = f"""
-    QPushButton {{
-        background-color: {colors["secondary"]};
-        color: {colors["white"]};
+    return _QSS_TEMPLATE.substitute(colors)
+
+
+# Rendered stylesheets by theme, filled on first use
+_PRECOMPUTED = {}
+
+
+def get_complete_style(theme: str = "Light"):
+    """Get complete stylesheet for the specified theme"""
+    key = "dark" if theme.lower() == "dark" else "light"
+    style = _PRECOMPUTED.get(key)
+    if style is None:
+        style = _PRECOMPUTED[key] = _build_complete_style(key)
+    return style
+
+# Generate style constants for backward compatibility
+_BUTTON_TEMPLATE = Template(_BUTTON_QSS)
+
+_SECONDARY_BUTTON_TEMPLATE = Template("""
+    QPushButton {
+        background-color: $secondary;
+        color: $white;
         border: none;
         border-radius: 6px;
         padding: 8px 16px;
         font-weight: 500;
         font-size: 14px;
-    }}
-    
-    QPushButton:hover {{
-        background-color: {colors["secondary_hover"]};
-    }}
+    }
     
-    QPushButton:pressed {{
-        background-color: {colors["secondary_hover"]};
-    }}
-    """
+    QPushButton:hover {
+        background-color: $secondary_hover;
+    }
     
-    outline_button_style = f"""
-    QPushButton {{
+    QPushButton:pressed {
+        background-color: $secondary_hover;
+    }
+    """)
+
+_OUTLINE_BUTTON_TEMPLATE = Template("""
+    QPushButton {
         background-color: transparent;
-        color: {colors["primary"]};
-        border: 2px solid {colors["primary"]};
+        color: $primary;
+        border: 2px solid $primary;
         border-radius: 6px;
         padding: 6px 14px;
         font-weight: 500;
         font-size: 14px;
-    }}
-    
-    QPushButton:hover {{
-        background-color: {colors["primary"]};
-        color: {colors["white"]};
-    }}
-    
-    QPushButton:pressed {{
-        background-color: {colors["primary_hover"]};
-        color: {colors["white"]};
-    }}
-    """
-    
-    server_button_style = f"""
-    QPushButton {{
-        background-color: {colors["surface"]};
-        color: {colors["text_primary"]};
-        border: 2px solid {colors["border"]};
+    }
+    
+    QPushButton:hover {
+        background-color: $primary;
+        color: $white;
+    }
+    
+    QPushButton:pressed {
+        background-color: $primary_hover;
+        color: $white;
+    }
+    """)
+
+_SERVER_BUTTON_TEMPLATE = Template("""
+    QPushButton {
+        background-color: $surface;
+        color: $text_primary;
+        border: 2px solid $border;
         border-radius: 6px;
         padding: 8px 16px;
         font-weight: 500;
         font-size: 14px;
         min-width: 100px;
-    }}
-    
-    QPushButton:hover {{
-        background-color: {colors["surface_hover"]};
-        border-color: {colors["primary"]};
-    }}
-    
-    QPushButton:checked {{
-        background-color: {colors["primary"]};
-        color: {colors["white"]};
-        border-color: {colors["primary"]};
-    }}
-    """
-    
-    return button_style, secondary_button_style, outline_button_style, server_button_style
+    }
+    
+    QPushButton:hover {
+        background-color: $surface_hover;
+        border-color: $primary;
+    }
+    
+    QPushButton:checked {
+        background-color: $primary;
+        color: $white;
+        border-color: $primary;
+    }
+    """)
+
+
+@lru_cache(maxsize=2)
+def _button_style(theme: str):
+    """Base button rules for a theme (BUTTON_STYLE)"""
+    return _BUTTON_TEMPLATE.substitute(get_theme_colors(theme))
+
+
+@lru_cache(maxsize=2)
+def _secondary_button_style(theme: str):
+    """Secondary button rules for a theme (SECONDARY_BUTTON_STYLE)"""
+    return _SECONDARY_BUTTON_TEMPLATE.substitute(get_theme_colors(theme))
+
+
+@lru_cache(maxsize=2)
+def _outline_button_style(theme: str):
+    """Outline button rules for a theme (OUTLINE_BUTTON_STYLE)"""
+    return _OUTLINE_BUTTON_TEMPLATE.substitute(get_theme_colors(theme))
+
+
+@lru_cache(maxsize=2)
+def _server_button_style(theme: str):
+    """Server button rules for a theme (SERVER_BUTTON_STYLE)"""
+    return _SERVER_BUTTON_TEMPLATE.substitute(get_theme_colors(theme))
+
+
+def _generate_style_constants(theme: str = "Light"):
+    """Generate style constants for the given theme"""
+    # Every non-dark name renders the light styles; share one cache slot
+    key = "dark" if theme.lower() == "dark" else "light"
+    return (_button_style(key), _secondary_button_style(key),
+            _outline_button_style(key), _server_button_style(key))
+
+# Backward compatibility constants are resolved on access (PEP 562) for the
+# theme last passed to update_style_constants
+_STYLE_CONSTANT_NAMES = ("BUTTON_STYLE", "SECONDARY_BUTTON_STYLE",
+                         "OUTLINE_BUTTON_STYLE", "SERVER_BUTTON_STYLE")
+_current_theme = "Light"
 
-# Initialize backward compatibility constants
-BUTTON_STYLE, SECONDARY_BUTTON_STYLE, OUTLINE_BUTTON_STYLE, SERVER_BUTTON_STYLE = _generate_style_constants("Light")
-COMPLETE_STYLE = get_complete_style("Light")
+def __getattr__(name: str):
+    if name == "COMPLETE_STYLE":
+        return get_complete_style(_current_theme)
+    if name in _STYLE_CONSTANT_NAMES:
+        return _generate_style_constants(_current_theme)[_STYLE_CONSTANT_NAMES.index(name)]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def update_style_constants(theme: str = "Light"):
     """Update style constants when theme changes"""
-    global BUTTON_STYLE, SECONDARY_BUTTON_STYLE, OUTLINE_BUTTON_STYLE, SERVER_BUTTON_STYLE, COMPLETE_STYLE
-    BUTTON_STYLE, SECONDARY_BUTTON_STYLE, OUTLINE_BUTTON_STYLE, SERVER_BUTTON_STYLE = _generate_style_constants(theme)
-    COMPLETE_STYLE = get_complete_style(theme)
\ No newline at end of file
+    global _current_theme
+    _current_theme = theme
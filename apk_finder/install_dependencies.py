@@ -4,13 +4,55 @@ APK Finder Dependency Installer
 Installs required Python packages for both server and client
 """
 
+import importlib.metadata
+import importlib.util
 import subprocess
 import sys
 import os
 
 
+# Server dependencies
+SERVER_DEPS = (
+    "fastapi==0.104.1",
+    "uvicorn==0.24.0", 
+    "redis==5.0.1",
+    "aiofiles==23.2.1",
+    "smbprotocol==1.12.0",
+    "APScheduler==3.10.4",
+    "loguru==0.7.2",
+    "python-dotenv==1.0.0",
+    "httpx==0.25.2",
+    "pydantic==2.5.0",
+    "python-multipart==0.0.6",
+    "cryptography==41.0.8"
+)
+
+# Client dependencies
+CLIENT_DEPS = (
+    "PyQt5==5.15.10",
+    "httpx==0.25.2",
+    "QtAwesome==1.3.1",
+    "pydantic==2.5.0",
+    "python-dotenv==1.0.0",
+    "requests==2.31.0",
+    "aiofiles==23.2.1"
+)
+
+
+def is_installed(requirement):
+    """Check if a pinned requirement like "fastapi==0.104.1" is already satisfied"""
+    name, _, version = requirement.partition("==")
+    try:
+        return importlib.metadata.version(name) == version
+    except importlib.metadata.PackageNotFoundError:
+        return False
+
+
 def install_package(package):
     """Install a Python package using pip"""
+    if is_installed(package):
+        print(f"✅ {package} already installed")
+        return True
     try:
         subprocess.check_call([sys.executable, "-m", "pip", "install", package])
         print(f"✅ Successfully installed {package}")
@@ -20,13 +62,31 @@ def install_package(package):
         return False
 
 
-def check_package(package):
-    """Check if a package is already installed"""
+def install_packages(packages):
+    """Install several Python packages with a single pip invocation
+    
+    Returns the set of packages that were installed successfully. If the
+    batch fails, each package is retried on its own to find the failures.
+    """
+    already_installed = {package for package in packages if is_installed(package)}
+    if already_installed:
+        print(f"✅ {len(already_installed)} packages already installed")
+    missing = [package for package in packages if package not in already_installed]
+    if not missing:
+        return already_installed
+    
     try:
-        __import__(package)
-        return True
-    except ImportError:
-        return False
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *missing])
+        print(f"✅ Successfully installed {len(missing)} packages")
+        return set(packages)
+    except subprocess.CalledProcessError:
+        print("⚠️ Batch installation failed, retrying packages one by one...")
+        return already_installed | {package for package in missing if install_package(package)}
+
+
+def check_package(package):
+    """Check if a package is already installed (without importing it)"""
+    return importlib.util.find_spec(package) is not None
 
 
 def main():
@@ -34,51 +94,19 @@ def main():
     print("🚀 APK Finder Dependency Installer")
     print("=" * 50)
     
-    # Server dependencies
-    server_deps = [
-        "fastapi==0.104.1",
-        "uvicorn==0.24.0", 
-        "redis==5.0.1",
-        "aiofiles==23.2.1",
-        "smbprotocol==1.12.0",
-        "APScheduler==3.10.4",
-        "loguru==0.7.2",
-        "python-dotenv==1.0.0",
-        "httpx==0.25.2",
-        "pydantic==2.5.0",
-        "python-multipart==0.0.6",
-        "cryptography==41.0.8"
-    ]
-    
-    # Client dependencies  
-    client_deps = [
-        "PyQt5==5.15.10",
-        "httpx==0.25.2",
-        "QtAwesome==1.3.1",
-        "pydantic==2.5.0",
-        "python-dotenv==1.0.0",
-        "requests==2.31.0",
-        "aiofiles==23.2.1"
-    ]
-    
-    print("\n📦 Installing Server Dependencies...")
-    server_success = 0
-    for dep in server_deps:
-        if install_package(dep):
-            server_success += 1
-    
-    print(f"\n📱 Installing Client Dependencies...")
-    client_success = 0
-    for dep in client_deps:
-        if install_package(dep):
-            client_success += 1
+    print("\n📦 Installing Server and Client Dependencies...")
+    # Packages shared by server and client are installed once, in listed order
+    all_deps = list(dict.fromkeys(SERVER_DEPS + CLIENT_DEPS))
+    installed = install_packages(all_deps)
+    server_success = sum(1 for dep in SERVER_DEPS if dep in installed)
+    client_success = sum(1 for dep in CLIENT_DEPS if dep in installed)
     
     print("\n" + "=" * 50)
     print("📊 Installation Summary:")
-    print(f"Server: {server_success}/{len(server_deps)} packages installed")
-    print(f"Client: {client_success}/{len(client_deps)} packages installed")
+    print(f"Server: {server_success}/{len(SERVER_DEPS)} packages installed")
+    print(f"Client: {client_success}/{len(CLIENT_DEPS)} packages installed")
     
-    if server_success == len(server_deps) and client_success == len(client_deps):
+    if server_success == len(SERVER_DEPS) and client_success == len(CLIENT_DEPS):
         print("\n✅ All dependencies installed successfully!")
         print("\n🎉 Next Steps:")
         print("1. Configure server: cd server && cp .env.example .env && edit .env")
@@ -88,11 +116,11 @@ def main():
         print("\n⚠️ Some dependencies failed to install.")
         print("Please check the error messages above and install manually if needed.")
         
-        if server_success < len(server_deps):
+        if server_success < len(SERVER_DEPS):
             print(f"\nFor server dependencies:")
             print(f"cd server && pip install -r requirements.txt")
             
-        if client_success < len(client_deps):
+        if client_success < len(CLIENT_DEPS):
             print(f"\nFor client dependencies:")
             print(f"cd client && pip install -r requirements.txt")
 
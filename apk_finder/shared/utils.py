@@ -1,3 +1,4 @@
+import functools
 import hashlib
 import os
 import re
@@ -17,6 +18,7 @@ def calculate_md5(file_path: str) -> str:
         return ""
 
 
+@functools.lru_cache(maxsize=4096)
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human readable format"""
     if size_bytes == 0: